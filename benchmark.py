@@ -0,0 +1,154 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from render_utils import QUALITIES
+
+HERE = Path(__file__).resolve().parent
+BASELINE = HERE / "benchmarks" / "baseline.json"
+TARGETS = [
+    ("verynice_Version11.py", "Restart"),
+    ("thisistheone.py", "Restart"),
+    ("finishedfortonight.py", "Restart"),
+    ("finishedfortonight_Version6.py", "Restart"),
+    ("needtofix.py", "Restart"),
+    ("manim_gcd_lcm_animation_Version24.py", "GCDLCMAnimation"),
+]
+METRICS = ("wall_time", "peak_rss_mb", "frames")
+SMOKE_QUALITY = "l"
+
+
+def _peak_rss_mb(usage):
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_once(script, scene, quality):
+    # One fresh process per run so peak RSS belongs to this render alone
+    with tempfile.TemporaryDirectory(prefix="bench_") as directory:
+        report_path = Path(directory) / "profile.json"
+        command = [sys.executable, str(HERE / "profiling.py"), str(HERE / script), scene,
+                   "-q", quality, "-o", str(report_path)]
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=HERE, stdout=subprocess.DEVNULL)
+        # os.wait4 reports the child's own resource use but is POSIX only;
+        # elsewhere peak RSS is not measured
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            peak_rss_mb = _peak_rss_mb(usage)
+        else:
+            process.wait()
+            peak_rss_mb = None
+        wall_time = time.perf_counter() - start
+        if process.returncode != 0:
+            raise RuntimeError(f"{script} {scene} failed with exit code {process.returncode}")
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+    sections = report["by_section"] if len(report["by_section"]) > 1 else report["by_helper"]
+    return {
+        "wall_time": wall_time,
+        "peak_rss_mb": peak_rss_mb,
+        "frames": report["frames"],
+        "sections": {name: group["total"] for name, group in sections.items()},
+    }
+
+
+def benchmark(targets, quality, runs):
+    results = {}
+    for script, scene in targets:
+        samples = [run_once(script, scene, quality) for _ in range(runs)]
+        best = min(samples, key=lambda s: s["wall_time"])
+        target = f"{script}:{scene}@{QUALITIES[quality]}"
+        results[target] = {
+            "wall_time": statistics.median(s["wall_time"] for s in samples),
+            "peak_rss_mb": max((s["peak_rss_mb"] for s in samples if s["peak_rss_mb"] is not None), default=None),
+            "frames": best["frames"],
+            "sections": best["sections"],
+        }
+        print(f"{target}: {results[target]['wall_time']:.2f}s")
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for target, result in results.items():
+        if target not in baseline:
+            print(f"{target}: no baseline")
+            continue
+        for metric in METRICS:
+            old, new = baseline[target][metric], result[metric]
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            marker = ""
+            if metric != "frames" and change > threshold:
+                marker = "  REGRESSION"
+                regressions.append((target, metric))
+            elif metric == "frames" and new != old:
+                marker = "  frame count changed"
+            print(f"{target} {metric:12s} {old:10.2f} -> {new:10.2f} ({change:+.1%}){marker}")
+        for section, cost in result["sections"].items():
+            old = baseline[target]["sections"].get(section)
+            if old and (cost - old) / old > threshold:
+                print(f"{target}   section {section}: {old:.2f}s -> {cost:.2f}s ({(cost - old) / old:+.1%})")
+    return regressions
+
+
+def smoke(targets):
+    # One low-quality run per target, checking the profiler produced a report
+    # with frames in it; nothing is compared or stored
+    failures = []
+    for script, scene in targets:
+        try:
+            sample = run_once(script, scene, SMOKE_QUALITY)
+        except Exception as exc:
+            failures.append(f"{script}:{scene}: {exc}")
+            continue
+        if not sample["frames"]:
+            failures.append(f"{script}:{scene}: the profile recorded no frames")
+            continue
+        print(f"{script}:{scene}: ok, {sample['frames']} frames in {sample['wall_time']:.2f}s")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark renders of every scene script against a stored baseline.")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-n", "--runs", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="script file names to benchmark")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--smoke", action="store_true", help="render each target once to check the profiler runs")
+    args = parser.parse_args()
+
+    targets = [t for t in TARGETS if not args.only or t[0] in args.only]
+    if args.smoke:
+        if not smoke(targets):
+            sys.exit(1)
+        return
+    results = benchmark(targets, args.quality, args.runs)
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        stored = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+        stored.update(results)
+        args.baseline.write_text(json.dumps(stored, indent=2), encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        sys.exit(f"No baseline at {args.baseline}; run with --save-baseline first")
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if compare(results, baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
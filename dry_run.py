@@ -0,0 +1,111 @@
+from manim import *
+import argparse
+import json
+import sys
+import time
+
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from render_utils import load_scene_class
+
+
+def calling_helper(scene):
+    # Innermost method of the scene's own class on the stack, e.g. arrange_final
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_code.co_name
+        if frame.f_locals.get("self") is scene and not hasattr(Scene, name) and not name.startswith("_"):
+            return name
+        frame = frame.f_back
+    return None
+
+
+def describe(mob):
+    label = getattr(mob, "tex_string", None) or getattr(mob, "text", None) or getattr(mob, "name", None)
+    info = {"type": type(mob).__name__, "label": label}
+    if len(mob.get_all_points()):
+        info["center"] = [round(float(c), 3) for c in mob.get_center()[:2]]
+        info["size"] = [round(float(mob.width), 3), round(float(mob.height), 3)]
+    return info
+
+
+def outside_frame(mob):
+    if not len(mob.get_all_points()):
+        return False
+    return (
+        mob.get_left()[0] < -config.frame_x_radius
+        or mob.get_right()[0] > config.frame_x_radius
+        or mob.get_bottom()[1] < -config.frame_y_radius
+        or mob.get_top()[1] > config.frame_y_radius
+    )
+
+
+class NullRenderer(CairoRenderer):
+    # Advances every animation straight to its final state and records the
+    # call instead of rasterizing or encoding anything.
+    def __init__(self, *args, **kwargs):
+        kwargs["skip_animations"] = True
+        super().__init__(*args, **kwargs)
+        self.records = []
+
+    def play(self, scene, *args, **kwargs):
+        start = self.time
+        super().play(scene, *args, **kwargs)
+        animations = scene.animations or []
+        is_wait = all(isinstance(a, Wait) for a in animations)
+        self.records.append({
+            "index": len(self.records),
+            "kind": "wait" if is_wait else "play",
+            "start": round(start, 3),
+            "duration": round(scene.duration, 3),
+            "helper": calling_helper(scene),
+            "animations": [type(a).__name__ for a in animations],
+            "mobjects": [describe(a.mobject) for a in animations if not isinstance(a, Wait)],
+            "out_of_frame": [describe(m) for m in scene.mobjects if outside_frame(m)],
+        })
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def add_frame(self, *args, **kwargs):
+        pass
+
+
+def dry_run(scene_cls):
+    with tempconfig({"dry_run": True, "disable_caching": True}):
+        renderer = NullRenderer()
+        scene = scene_cls(renderer=renderer)
+        scene.render()
+    return renderer.records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run construct without rasterizing and list every play/wait.")
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("--json", dest="json_path", help="write the play/wait records to this file")
+    parser.add_argument("--strict", action="store_true", help="exit non-zero if anything leaves the frame")
+    args = parser.parse_args()
+
+    scene_cls = load_scene_class(args.script, args.scene)
+    start = time.perf_counter()
+    records = dry_run(scene_cls)
+    elapsed = time.perf_counter() - start
+
+    for record in records:
+        mobjects = ", ".join(m["label"] or m["type"] for m in record["mobjects"])
+        print(f"{record['index']:4d} {record['start']:8.2f}s {record['kind']:4s} "
+              f"{record['duration']:5.2f}s {record['helper'] or '':28s} {mobjects}")
+        for mob in record["out_of_frame"]:
+            print(f"     out of frame: {mob['label'] or mob['type']} at {mob.get('center')}")
+    total = sum(r["duration"] for r in records)
+    print(f"{len(records)} calls, {total:.1f}s of video, dry run took {elapsed:.2f}s")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2)
+    if args.strict and any(r["out_of_frame"] for r in records):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
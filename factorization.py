@@ -0,0 +1,224 @@
+import random
+import time
+from array import array
+from math import gcd, isqrt
+
+DEFAULT_SIEVE_LIMIT = 1_000_000
+# Above this, wheel trial division is replaced by Miller-Rabin + Pollard-Brent
+LARGE_INPUT = 10 ** 12
+SMALL_PRIME_BOUND = 10_000
+# The first 13 primes as witnesses make Miller-Rabin deterministic below
+# MILLER_RABIN_LIMIT (about 3.3 * 10**24); above it a pass is only probable
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MILLER_RABIN_LIMIT = 3_317_044_064_679_887_385_961_981
+# Gaps between numbers coprime to 2*3*5, starting from 7
+WHEEL_GAPS = (4, 2, 4, 2, 4, 6, 2, 6)
+
+_sieve_limit = DEFAULT_SIEVE_LIMIT
+_spf = None
+_small_prime_list = None
+_cache = {}
+# n -> (factors, time budget) for factorizations the budget cut short
+_incomplete = {}
+
+
+def set_sieve_limit(limit):
+    global _sieve_limit, _spf
+    if limit != _sieve_limit:
+        _sieve_limit = limit
+        _spf = None
+
+
+def smallest_prime_factors(limit):
+    # spf[n] is the smallest prime dividing n. Marking multiples of larger
+    # primes first lets smaller primes overwrite them with C-level slice
+    # assignments instead of a per-element Python loop.
+    is_prime = bytearray([1]) * (limit + 1)
+    is_prime[:2] = b"\x00\x00"
+    for i in range(2, isqrt(limit) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    spf = array("I", range(limit + 1))
+    for p in reversed(range(2, isqrt(limit) + 1)):
+        if is_prime[p]:
+            count = len(range(p * p, limit + 1, p))
+            spf[p * p::p] = array("I", [p]) * count
+    return spf
+
+
+def _sieve():
+    global _spf
+    if _spf is None:
+        _spf = smallest_prime_factors(_sieve_limit)
+    return _spf
+
+
+def _factor_with_sieve(n, factors):
+    spf = _sieve()
+    while n > 1:
+        p = spf[n]
+        factors.append(p)
+        n //= p
+
+
+def _wheel_divisors():
+    yield from (2, 3, 5)
+    d = 7
+    while True:
+        for gap in WHEEL_GAPS:
+            yield d
+            d += gap
+
+
+def _factor_with_wheel(n, factors):
+    for d in _wheel_divisors():
+        if n <= _sieve_limit:
+            _factor_with_sieve(n, factors)
+            return
+        if d * d > n:
+            factors.append(n)
+            return
+        while n % d == 0:
+            factors.append(d)
+            n //= d
+
+
+def is_probable_prime(n):
+    if n < 2:
+        return False
+    for p in MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _expired(deadline):
+    return deadline is not None and time.monotonic() > deadline
+
+
+def pollard_brent(n, deadline=None):
+    # A non-trivial factor of the composite n, or None if the deadline passes.
+    # The deadline is checked every m steps, as r grows without bound.
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for k in range(0, r, m):
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                if _expired(deadline):
+                    return None
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+                if g == 1 and _expired(deadline):
+                    return None
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def _factor_large(n, factors, deadline, progress):
+    for p in _small_primes():
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    pending, unresolved = [n], []
+    while pending:
+        m = pending.pop()
+        if m == 1:
+            continue
+        if m <= _sieve_limit:
+            _factor_with_sieve(m, factors)
+        elif is_probable_prime(m):
+            # Not proven prime above the deterministic bound
+            (factors if m < MILLER_RABIN_LIMIT else unresolved).append(m)
+        else:
+            d = None
+            if deadline is None or time.monotonic() < deadline:
+                d = pollard_brent(m, deadline)
+            if d is None:
+                unresolved.append(m)
+            else:
+                pending.extend((d, m // d))
+        if progress is not None:
+            progress(sorted(factors), pending + unresolved)
+    return unresolved
+
+
+def _small_primes():
+    global _small_prime_list
+    if _small_prime_list is None:
+        spf = _sieve()
+        bound = min(SMALL_PRIME_BOUND, _sieve_limit)
+        _small_prime_list = [p for p in range(2, bound + 1) if spf[p] == p]
+    return _small_prime_list
+
+
+def factorize(n, time_budget=None, progress=None):
+    # Returns (factors, complete). If the time budget runs out, the composite
+    # cofactors that could not be split are returned as factors and complete
+    # is False; so are factors too large to prove prime. progress(found,
+    # remaining) is called as factors are found.
+    if n < 2:
+        return [], True
+    if n in _cache:
+        return list(_cache[n]), True
+    # A second call with no more time than the first would only spend it again
+    if n in _incomplete and time_budget is not None and time_budget <= _incomplete[n][1]:
+        return list(_incomplete[n][0]), False
+    factors = []
+    if n <= _sieve_limit:
+        _factor_with_sieve(n, factors)
+        unresolved = []
+    elif n <= LARGE_INPUT:
+        _factor_with_wheel(n, factors)
+        unresolved = []
+    else:
+        deadline = None if time_budget is None else time.monotonic() + time_budget
+        unresolved = _factor_large(n, factors, deadline, progress)
+    factors = sorted(factors + unresolved)
+    if unresolved:
+        if time_budget is not None:
+            _incomplete[n] = (tuple(factors), time_budget)
+        return factors, False
+    _cache[n] = tuple(factors)
+    return factors, True
+
+
+def prime_factors(n, time_budget=None, progress=None):
+    # Prime factors of n with multiplicity, in ascending order. Results are
+    # memoized for the whole process, so every scene shares them.
+    return factorize(n, time_budget, progress)[0]
+
+
+def clear_cache():
+    _cache.clear()
+    _incomplete.clear()
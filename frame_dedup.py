@@ -0,0 +1,109 @@
+from manim import *
+import hashlib
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+
+from render_utils import FFMPEG
+
+HELD_FRAME_EXTENSIONS = (".mp4",)
+
+
+class HeldFrameFileWriter(SceneFileWriter):
+    # Runs of identical frames are coalesced instead of being piped one by one.
+    # A partial movie that is a single held frame (a static self.wait) never
+    # opens the pipe at all: it is encoded from one PNG with ffmpeg -loop,
+    # and identical holds are reused from disk.
+    _allow_write = False
+    _stream_open = False
+    _held_frame = None
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self._allow_write = allow_write
+        self._file_path = file_path
+        self._stream_open = False
+        self._held_frame = None
+        self._held_count = 0
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        frame = frame_or_renderer
+        if not isinstance(frame, np.ndarray) or not self._allow_write:
+            for _ in range(num_frames):
+                super().write_frame(frame_or_renderer)
+            return
+        if self._held_frame is not None and (
+            frame is self._held_frame or np.array_equal(frame, self._held_frame)
+        ):
+            self._held_count += num_frames
+            return
+        self._flush_held()
+        self._held_frame = frame
+        self._held_count = num_frames
+
+    def _open_stream(self):
+        if not self._stream_open:
+            super().begin_animation(self._allow_write, self._file_path)
+            self._stream_open = True
+
+    def _flush_held(self):
+        if self._held_frame is None:
+            return
+        self._open_stream()
+        for _ in range(self._held_count):
+            super().write_frame(self._held_frame)
+        self._held_frame = None
+        self._held_count = 0
+
+    def end_animation(self, allow_write=False):
+        if not self._stream_open and self._held_frame is not None and self._encode_held_frame():
+            self._held_frame = None
+            return
+        self._flush_held()
+        if self._stream_open:
+            super().end_animation(allow_write)
+
+    def _encode_held_frame(self):
+        # Dry runs and --format png have no partial movie to stand in for
+        if not write_to_movie():
+            return False
+        if config.movie_file_extension not in HELD_FRAME_EXTENSIONS or config.transparent:
+            return False
+        target = Path(self._file_path or self.sections[-1].partial_movie_files[-1])
+        digest = hashlib.sha256(self._held_frame.tobytes()).hexdigest()[:16]
+        held_movie = target.with_name(f"held_{digest}_{self._held_count}{target.suffix}")
+        if not held_movie.exists():
+            png = held_movie.with_suffix(".png")
+            Image.fromarray(self._held_frame).convert("RGB").save(png)
+            try:
+                subprocess.run(
+                    [FFMPEG, "-y", "-loglevel", "error",
+                     "-loop", "1", "-framerate", str(config.frame_rate), "-i", str(png),
+                     "-frames:v", str(self._held_count), "-r", str(config.frame_rate),
+                     "-vcodec", "libx264", "-pix_fmt", "yuv420p", "-an", str(held_movie)],
+                    check=True,
+                )
+            except (OSError, subprocess.CalledProcessError):
+                return False
+            finally:
+                png.unlink(missing_ok=True)
+        if held_movie != target:
+            shutil.copyfile(held_movie, target)
+        return True
+
+
+class HeldFrameScene(Scene):
+    file_writer_class = HeldFrameFileWriter
+
+    def __init__(self, *args, **kwargs):
+        if kwargs.get("renderer") is None:
+            kwargs["renderer"] = CairoRenderer(
+                file_writer_class=self.file_writer_class,
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(*args, **kwargs)
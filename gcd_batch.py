@@ -0,0 +1,188 @@
+from manim import *
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import gcd_cache
+from render_utils import QUALITIES, load_scene_class, output_name
+
+SCRIPT = "manim_gcd_lcm_animation_Version24.py"
+SCENE = "GCDLCMAnimation"
+# Scene class attributes a job may set besides its numbers
+JOB_OPTIONS = {"group_exponents": bool, "factor_time_budget": float, "method": str}
+# GCDLCMAnimation has one input color for each of at most this many numbers
+MIN_NUMBERS, MAX_NUMBERS = 2, 8
+
+_scene_cls = None
+
+
+def _number(value):
+    # Whole numbers only: JSON true or 2.5 and CSV "2.5" are mistakes, not 1 and 2
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{value!r} is not a whole number")
+    if value < 1:
+        raise ValueError(f"{value} is not a positive number")
+    return value
+
+
+def _job(numbers, options, name, where):
+    unknown = set(options) - set(JOB_OPTIONS)
+    if unknown:
+        raise ValueError(f"unknown job options {sorted(unknown)}")
+    if not isinstance(numbers, list) or not MIN_NUMBERS <= len(numbers) <= MAX_NUMBERS:
+        raise ValueError(f"a job takes {MIN_NUMBERS} to {MAX_NUMBERS} numbers, got {numbers!r}")
+    options = {key: JOB_OPTIONS[key](value) for key, value in options.items()}
+    # Canonical order, so (15, 9) and (9, 15) are one job and one cache entry
+    numbers = list(gcd_cache.canonical_numbers(_number(n) for n in numbers))
+    if not name:
+        name = "GCDLCM_" + "_".join(map(str, numbers)) + ("_grouped" if options.get("group_exponents") else "")
+    return {"name": output_name(str(name)), "numbers": numbers, "options": options, "row": where}
+
+
+def _csv_flag(value):
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+def _jsonl_job(line, where):
+    job = json.loads(line)
+    if isinstance(job, list):
+        job = {"numbers": job}
+    if not isinstance(job, dict) or "numbers" not in job:
+        raise ValueError("expected a list of numbers or an object with \"numbers\"")
+    numbers, name = job.pop("numbers"), job.pop("name", None)
+    return _job(numbers, job, name, where)
+
+
+def _csv_job(cells, header, where):
+    fields = dict(zip(header, cells)) if header else dict(enumerate(cells))
+    name = fields.pop("name", None)
+    options = {key: fields.pop(key) for key in JOB_OPTIONS if fields.get(key)}
+    if "group_exponents" in options:
+        options["group_exponents"] = _csv_flag(options["group_exponents"])
+    numbers = [cell for cell in fields.values() if cell]
+    return _job(numbers, options, name, where)
+
+
+def read_jobs(path):
+    # Yields jobs one line at a time. A JSONL line is a list of numbers or an
+    # object with "numbers" and optional "name" and JOB_OPTIONS keys. A CSV row
+    # is the numbers. A CSV file has a header if and only if its first row
+    # names a "name" or JOB_OPTIONS column; the header's other columns, and
+    # every non-empty cell under them, are numbers. A row that is not a valid
+    # job is yielded as {"row", "error"} and reading goes on.
+    path = Path(path)
+    with path.open(encoding="utf-8", newline="") as f:
+        jsonl = path.suffix == ".jsonl"
+        if jsonl:
+            rows = ((line_number, line) for line_number, line in enumerate(f, 1) if line.strip())
+        else:
+            rows = ((line_number, [cell.strip() for cell in row]) for line_number, row in enumerate(csv.reader(f), 1))
+            rows = ((line_number, cells) for line_number, cells in rows if any(cells))
+            header = None
+            first = next(rows, None)
+            if first is not None and {"name", *JOB_OPTIONS} & set(first[1]):
+                header = first[1]
+            elif first is not None:
+                rows = itertools.chain([first], rows)
+        for line_number, row in rows:
+            where = f"{path}:{line_number}"
+            try:
+                yield _jsonl_job(row, where) if jsonl else _csv_job(row, header, where)
+            except (ValueError, TypeError) as exc:
+                logger.error(f"Skipping {where}: {exc}")
+                yield {"row": where, "error": str(exc)}
+
+
+def _init_worker(script, scene_name):
+    # Each worker imports manim and the scene once and keeps its factorization
+    # and label caches for every job it renders. The tex cache is on disk and
+    # shared by all workers.
+    global _scene_cls
+    _scene_cls = load_scene_class(script, scene_name)
+
+
+def render_job(job, quality, key):
+    scene_cls = type(job["name"], (_scene_cls,), {"numbers": tuple(job["numbers"]), **job["options"]})
+    scene_cls.__module__ = _scene_cls.__module__
+    start = time.perf_counter()
+    with tempconfig({"quality": quality, "output_file": job["name"]}):
+        scene = scene_cls()
+        scene.render()
+        output = str(scene.renderer.file_writer.movie_file_path)
+        output = gcd_cache.store(key, job["numbers"], job["options"], quality, output)
+    return {**job, "output": output, "seconds": round(time.perf_counter() - start, 2), "cached": False}
+
+
+def render_batch(job_file, script=SCRIPT, scene_name=SCENE, quality="low_quality", jobs=None, manifest=None):
+    manifest = Path(manifest or Path(job_file).with_suffix(".manifest.json"))
+    scene_cls = load_scene_class(script, scene_name)
+    context = multiprocessing.get_context("spawn")
+    # A job whose cache entry exists, or that repeats an earlier job, is only
+    # a lookup; the rest render on the pool.
+    pending, results = {}, []
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=context,
+                             initializer=_init_worker, initargs=(script, scene_name)) as pool:
+        for job in read_jobs(job_file):
+            if "error" in job:
+                results.append(job)
+                continue
+            key = gcd_cache.cache_key(scene_cls, job["numbers"], job["options"], quality)
+            entry = gcd_cache.lookup(key)
+            if entry is not None:
+                results.append({**job, "output": entry["output"], "seconds": 0.0, "cached": True})
+            elif key in pending:
+                results.append((job, pending[key], True))
+            else:
+                pending[key] = pool.submit(render_job, job, quality, key)
+                results.append((job, pending[key], False))
+        for i, result in enumerate(results):
+            if isinstance(result, dict):
+                continue
+            job, future, repeat = result
+            try:
+                results[i] = {**future.result(), **job}
+                if repeat:
+                    results[i].update(seconds=0.0, cached=True)
+            except Exception as exc:
+                logger.error(f"Job {job['name']} failed: {exc!r}")
+                results[i] = {**job, "error": repr(exc)}
+    manifest.write_text(json.dumps({"quality": quality, "jobs": results}, indent=2), encoding="utf-8")
+    return manifest, results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render one GCD/LCM video per job in a CSV or JSONL file.",
+        epilog='A job may set method to "factor", "euclid" or "auto" (the default), which matches prime factors '
+               "unless a number is too large for its factors to be proven prime and runs the Euclidean "
+               "algorithm otherwise.",
+    )
+    parser.add_argument("jobs_file")
+    parser.add_argument("--script", default=SCRIPT)
+    parser.add_argument("--scene", default=SCENE)
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("-o", "--manifest", help="defaults to the jobs file with a .manifest.json suffix")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest, results = render_batch(args.jobs_file, args.script, args.scene, QUALITIES[args.quality],
+                                     args.jobs, args.manifest)
+    failed = sum(1 for result in results if "error" in result)
+    cached = sum(1 for result in results if result.get("cached"))
+    print(f"{len(results) - failed - cached} rendered, {cached} from cache, {failed} failed, manifest {manifest} "
+          f"({time.perf_counter() - start:.1f}s)")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+from manim import *
+import hashlib
+import json
+import os
+import shutil
+from math import gcd, lcm
+from pathlib import Path
+
+from factorization import DEFAULT_SIEVE_LIMIT, factorize
+from render_utils import local_sources
+
+GCD_CACHE_DIRNAME = "gcd_cache"
+# Factoring anything the default sieve covers is cheaper than reading a file
+STORED_FACTOR_MIN = DEFAULT_SIEVE_LIMIT
+# Seconds per number spent factoring for the lookup table; usually the scene
+# already factored it and the in-process cache answers at once
+STORE_FACTOR_BUDGET = 1.0
+
+
+def gcd_cache_dir():
+    return Path(config.get_dir("media_dir")) / GCD_CACHE_DIRNAME
+
+
+def _write_json(path, data):
+    # Write-then-rename so concurrent workers never read a partial entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    partial.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(partial, path)
+
+
+def canonical_numbers(numbers):
+    # GCD and LCM do not depend on the order of their inputs
+    return tuple(sorted(numbers))
+
+
+def code_hash(scene_cls):
+    # Every repository module the scene reaches, so a change to factoring,
+    # tex batching or frame encoding also retires the cached videos
+    hasher = hashlib.sha256()
+    for source in local_sources(scene_cls.__module__):
+        hasher.update(source.encode())
+    return hasher.hexdigest()[:16]
+
+
+def cache_key(scene_cls, numbers, options, quality):
+    key = json.dumps(
+        [canonical_numbers(numbers), sorted(options.items()), quality, code_hash(scene_cls)]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()[:24]
+
+
+def load_factors(n):
+    if n < STORED_FACTOR_MIN:
+        return None
+    path = gcd_cache_dir() / "factors" / f"{n}.json"
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else None
+
+
+def save_factors(n, factors):
+    if n >= STORED_FACTOR_MIN:
+        _write_json(gcd_cache_dir() / "factors" / f"{n}.json", factors)
+
+
+def lookup(key):
+    # The cache entry for key, or None unless its video is still on disk
+    path = gcd_cache_dir() / f"{key}.json"
+    if not path.exists():
+        return None
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    entry["output"] = str(gcd_cache_dir() / entry["output"])
+    return entry if Path(entry["output"]).exists() else None
+
+
+def store(key, numbers, options, quality, movie):
+    movie = Path(movie)
+    cached_movie = gcd_cache_dir() / f"{key}{movie.suffix}"
+    cached_movie.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(movie, cached_movie)
+    numbers = canonical_numbers(numbers)
+    factors = {}
+    for n in set(numbers):
+        found, complete = factorize(n, STORE_FACTOR_BUDGET)
+        if complete:
+            factors[str(n)] = found
+    _write_json(gcd_cache_dir() / f"{key}.json", {
+        "numbers": numbers,
+        "options": options,
+        "quality": quality,
+        "gcd": gcd(*numbers),
+        "lcm": lcm(*numbers),
+        "factors": factors,
+        "output": cached_movie.name,
+    })
+    return str(cached_movie)
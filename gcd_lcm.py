@@ -0,0 +1,91 @@
+from collections import Counter, defaultdict, namedtuple
+
+# A match gathers one term of the same prime from some of the inputs; members
+# are (input, term index) pairs. Slots count positions in the GCF/LCM rows,
+# slot 0 being the leading (1); gcf_slot is None when the match skips the GCF.
+Match = namedtuple("Match", "prime members gcf_exponent lcm_exponent gcf_slot lcm_slot")
+MatchPlan = namedtuple("MatchPlan", "common lcm_only")
+
+
+def factor_terms(factors, group_exponents=False):
+    # (prime, exponent) terms as they are written under a number: one per
+    # prime occurrence, or one per distinct prime with its multiplicity.
+    if group_exponents:
+        return list(Counter(factors).items())
+    return [(p, 1) for p in factors]
+
+
+def power_tex(prime, exponent):
+    return f"({prime})" if exponent == 1 else f"({prime})^{{{exponent}}}"
+
+
+def join_numbers(numbers):
+    *rest, last = [str(n) for n in numbers]
+    return f"{', '.join(rest)} and {last}" if rest else last
+
+
+def plan_matching(term_lists):
+    # The r-th term of a prime in every input that has one forms a match, so a
+    # single pass over the terms builds the k-way multiset intersection and
+    # union. A match every input takes part in sends its smaller exponent to
+    # the GCF and its larger one to the LCM; the others only feed the LCM.
+    rounds = defaultdict(list)
+    for k, terms in enumerate(term_lists):
+        seen = Counter()
+        for index, (p, e) in enumerate(terms):
+            rounds[p, seen[p]].append((k, index, e))
+            seen[p] += 1
+    common, lcm_only = [], []
+    for (p, _), round_terms in sorted(rounds.items()):
+        members = [(k, index) for k, index, _ in round_terms]
+        exponents = [e for _, _, e in round_terms]
+        if len(round_terms) == len(term_lists):
+            common.append((p, members, min(exponents), max(exponents)))
+        else:
+            lcm_only.append((p, members, 0, max(exponents)))
+    # Play the LCM-only matches in the order their first term is written
+    lcm_only.sort(key=lambda match: match[1][0])
+    plan = MatchPlan([], [])
+    for slot, (p, members, gcf_exponent, lcm_exponent) in enumerate(common, 1):
+        plan.common.append(Match(p, members, gcf_exponent, lcm_exponent, slot, slot))
+    for slot, (p, members, _, lcm_exponent) in enumerate(lcm_only, len(common) + 1):
+        plan.lcm_only.append(Match(p, members, 0, lcm_exponent, None, slot))
+    return plan
+
+
+def euclid_steps(a, b):
+    # (a, b, q, r) with a = q * b + r for every division of the Euclidean
+    # algorithm; the last has r == 0 and its b is gcd(a, b). There are
+    # O(log min(a, b)) of them.
+    steps = []
+    while b:
+        q, r = divmod(a, b)
+        steps.append((a, b, q, r))
+        a, b = b, r
+    return steps
+
+
+RowLayout = namedtuple("RowLayout", "scale width positions")
+# Rows are never shrunk below this, even if they still overflow their box
+MIN_ROW_SCALE = 0.25
+
+
+def fit_row(widths, line_height, max_width, max_height, gap):
+    # Breaks a row of tokens into lines greedily, shrinking it until every line
+    # fits max_width and all lines fit max_height. positions holds each
+    # token's left edge and its line's offset below the first line, both at
+    # the returned scale.
+    scale = 1.0
+    while True:
+        positions, x, line, width = [], 0.0, 0, 0.0
+        for w in widths:
+            w *= scale
+            if x > 0 and x + w > max_width:
+                x, line = 0.0, line + 1
+            positions.append((x, line * line_height * scale))
+            width = max(width, x + w)
+            x += w + gap * scale
+        fits = width <= max_width and (line + 1) * line_height * scale <= max_height
+        if fits or scale * 0.9 < MIN_ROW_SCALE:
+            return RowLayout(scale, width, positions)
+        scale *= 0.9
@@ -0,0 +1,125 @@
+from functools import lru_cache
+
+import numpy as np
+
+LAYOUT_CACHE_SIZE = 256
+
+
+class Layout:
+    # Edge and corner quantities for one set of named points, computed for
+    # every pair and triple at once. Entry [i, j] of the edge arrays belongs to
+    # the edge from point i to point j; bisectors[v, a, b] is the unit bisector
+    # of the angle at v between a and b.
+    def __init__(self, names, points):
+        self.index = {name: i for i, name in enumerate(names)}
+        self.points = points
+        diff = points[None, :, :] - points[:, None, :]
+        self.lengths = np.linalg.norm(diff, axis=-1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.units = diff / self.lengths[..., None]
+            self.midpoints = (points[None, :, :] + points[:, None, :]) / 2
+            # Left normals, the unit edge turned a quarter turn counterclockwise
+            self.normals = np.stack(
+                [-self.units[..., 1], self.units[..., 0], np.zeros_like(self.lengths)], axis=-1
+            )
+            sums = self.units[:, :, None, :] + self.units[:, None, :, :]
+            self.bisectors = sums / np.linalg.norm(sums, axis=-1, keepdims=True)
+        # Layouts are shared through the cache, so callers only get read-only views
+        for array in (self.points, self.lengths, self.units, self.midpoints, self.normals, self.bisectors):
+            array.flags.writeable = False
+
+    def _ij(self, a, b):
+        return self.index[a], self.index[b]
+
+    def point(self, name):
+        return self.points[self.index[name]]
+
+    def length(self, a, b):
+        return self.lengths[self._ij(a, b)]
+
+    def unit(self, a, b):
+        return self.units[self._ij(a, b)]
+
+    def midpoint(self, a, b):
+        return self.midpoints[self._ij(a, b)]
+
+    def normal(self, a, b):
+        return self.normals[self._ij(a, b)]
+
+    def anchor(self, a, b, distance):
+        # Label position beside edge a -> b: its midpoint pushed along the left
+        # normal, or the right one for a negative distance
+        i, j = self._ij(a, b)
+        return self.midpoints[i, j] + distance * self.normals[i, j]
+
+    def bisector(self, vertex, a, b):
+        return self.bisectors[self.index[vertex], self.index[a], self.index[b]]
+
+    def right_angle(self, vertex, a, b, size):
+        # Corners of the square mark at vertex spanned by the edges to a and b
+        v = self.point(vertex)
+        p1 = v + size * self.unit(vertex, a)
+        p3 = v + size * self.unit(vertex, b)
+        return [v, p1, p1 + (p3 - v), p3]
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _cached_layout(names, flat):
+    return Layout(names, np.array(flat, dtype=float).reshape(len(names), 3))
+
+
+def layout_of(**points):
+    # The Layout of these named points; the same names at the same positions
+    # share one instance.
+    names = tuple(points)
+    flat = tuple(float(x) for p in points.values() for x in np.asarray(p, dtype=float)[:3])
+    return _cached_layout(names, flat)
+
+
+class Construction:
+    # Points declared once as functions of other points and evaluated on
+    # first use. Moving a free point drops the cached values downstream of it
+    # only; apply() moves every free point by the same map.
+    def __init__(self, **free):
+        self._free = {name: _frozen(p) for name, p in free.items()}
+        self._rules = {}
+        self._dependents = {}
+        self._values = {}
+
+    def define(self, name, rule, *inputs):
+        self._rules[name] = (rule, inputs)
+        for source in inputs:
+            self._dependents.setdefault(source, set()).add(name)
+        self._invalidate(name)
+
+    def __getitem__(self, name):
+        if name in self._free:
+            return self._free[name]
+        if name not in self._values:
+            rule, inputs = self._rules[name]
+            self._values[name] = _frozen(rule(*(self[source] for source in inputs)))
+        return self._values[name]
+
+    def _invalidate(self, name):
+        pending = [name]
+        while pending:
+            name = pending.pop()
+            self._values.pop(name, None)
+            pending.extend(self._dependents.get(name, ()))
+
+    def move(self, **points):
+        for name, p in points.items():
+            self._free[name] = _frozen(p)
+            self._invalidate(name)
+
+    def apply(self, transform):
+        # transform maps an (N, 3) array of the free points to their new places
+        names = list(self._free)
+        moved = transform(np.array([self._free[name] for name in names]))
+        self.move(**dict(zip(names, moved)))
+
+
+def _frozen(p):
+    p = np.array(p, dtype=float)
+    p.flags.writeable = False
+    return p
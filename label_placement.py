@@ -0,0 +1,119 @@
+from collections import defaultdict
+from math import floor
+
+GRID_CELL = 0.5
+LABEL_PADDING = 0.05
+# Distances from an edge to a label center tried for edge labels, and where
+# along the edge, nearest the midpoint first
+EDGE_OFFSETS = (0.12, 0.18, 0.24, 0.32, 0.42, 0.55)
+EDGE_FRACTIONS = (0.5, 0.4, 0.6, 0.3, 0.7)
+# Distances from a vertex along the angle bisector tried for angle labels
+ANGLE_DISTANCES = (0.35, 0.45, 0.55, 0.7, 0.85, 1.0, 1.2, 1.4)
+
+
+def box_around(center, width, height, padding=0.0):
+    half_w, half_h = width / 2 + padding, height / 2 + padding
+    return (center[0] - half_w, center[1] - half_h, center[0] + half_w, center[1] + half_h)
+
+
+def boxes_overlap(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def segment_hits_box(p, q, box):
+    # Liang-Barsky: clip the segment to the box and see if anything is left
+    t0, t1 = 0.0, 1.0
+    for start, delta, low, high in ((p[0], q[0] - p[0], box[0], box[2]), (p[1], q[1] - p[1], box[1], box[3])):
+        if delta == 0:
+            if not low <= start <= high:
+                return False
+            continue
+        ta, tb = (low - start) / delta, (high - start) / delta
+        if ta > tb:
+            ta, tb = tb, ta
+        t0, t1 = max(t0, ta), min(t1, tb)
+        if t0 > t1:
+            return False
+    return True
+
+
+class SpatialGrid:
+    # Uniform grid over bounding boxes. An item is filed under every cell its
+    # box touches, so a query only looks at items near the box it asks about.
+    def __init__(self, cell=GRID_CELL):
+        self.cell = cell
+        self.cells = defaultdict(list)
+
+    def _cells(self, box):
+        x0, y0 = floor(box[0] / self.cell), floor(box[1] / self.cell)
+        x1, y1 = floor(box[2] / self.cell), floor(box[3] / self.cell)
+        return ((i, j) for i in range(x0, x1 + 1) for j in range(y0, y1 + 1))
+
+    def insert(self, box, item):
+        for cell in self._cells(box):
+            self.cells[cell].append(item)
+
+    def query(self, box):
+        return {item for cell in self._cells(box) for item in self.cells.get(cell, ())}
+
+
+class LabelPlacer:
+    # Places labels among segments and boxes that are already taken. Each
+    # label gets its first candidate position that collides with nothing, or
+    # the one with the fewest collisions, and then blocks later labels.
+    def __init__(self, segments=(), boxes=(), cell=GRID_CELL, padding=LABEL_PADDING):
+        self.grid = SpatialGrid(cell)
+        self.obstacles = []
+        self.padding = padding
+        for p, q in segments:
+            box = (min(p[0], q[0]), min(p[1], q[1]), max(p[0], q[0]), max(p[1], q[1]))
+            self._add(("segment", p, q), box)
+        for box in boxes:
+            self._add(("box", box), box)
+
+    def _add(self, obstacle, box):
+        self.grid.insert(box, len(self.obstacles))
+        self.obstacles.append(obstacle)
+
+    def collisions(self, box):
+        hits = 0
+        for index in self.grid.query(box):
+            kind, *shape = self.obstacles[index]
+            if kind == "segment":
+                hits += segment_hits_box(shape[0], shape[1], box)
+            else:
+                hits += boxes_overlap(shape[0], box)
+        return hits
+
+    def place(self, requests):
+        # requests are (width, height, candidates) in priority order; returns
+        # the chosen center of each label
+        centers = []
+        for width, height, candidates in requests:
+            best, fewest = None, None
+            for candidate in candidates:
+                hits = self.collisions(box_around(candidate, width, height, self.padding))
+                if fewest is None or hits < fewest:
+                    best, fewest = candidate, hits
+                if hits == 0:
+                    break
+            self._add(("box", box_around(best, width, height)), box_around(best, width, height))
+            centers.append(best)
+        return centers
+
+
+def edge_candidates(layout, a, b, side=1):
+    # Beside edge a -> b, on its left for side=1 and its right for side=-1,
+    # nearest and most central first, then the same on the other side
+    p, q = layout.point(a), layout.point(b)
+    normal = layout.normal(a, b)
+    return [
+        p + f * (q - p) + s * d * normal
+        for s in (side, -side) for d in EDGE_OFFSETS for f in EDGE_FRACTIONS
+    ]
+
+
+def angle_candidates(layout, vertex, a, b):
+    # Inside the angle at vertex between a and b, along its bisector
+    v, bisector = layout.point(vertex), layout.bisector(vertex, a, b)
+    return [v + d * bisector for d in ANGLE_DISTANCES]
@@ -0,0 +1,32 @@
+from manim import *
+
+# Each distinct label is parsed and converted to beziers once per process;
+# call sites get a copy of the cached prototype.
+_MATH_LABELS = {}
+_TEXT_LABELS = {}
+
+
+def _style(font_size, color):
+    style = {"font_size": font_size}
+    if color is not None:
+        style["color"] = color
+    return style
+
+
+def math_label(*tex_strings, font_size=DEFAULT_FONT_SIZE, color=None):
+    key = (tex_strings, font_size, None if color is None else str(color))
+    if key not in _MATH_LABELS:
+        _MATH_LABELS[key] = MathTex(*tex_strings, **_style(font_size, color))
+    return _MATH_LABELS[key].copy()
+
+
+def text_label(text, font_size=DEFAULT_FONT_SIZE, color=None):
+    key = (text, font_size, None if color is None else str(color))
+    if key not in _TEXT_LABELS:
+        _TEXT_LABELS[key] = Text(text, **_style(font_size, color))
+    return _TEXT_LABELS[key].copy()
+
+
+def clear_label_cache():
+    _MATH_LABELS.clear()
+    _TEXT_LABELS.clear()
@@ -1,153 +1,281 @@
 from manim import *
+from collections import namedtuple
+from math import prod
 
-class GCDLCMAnimation(Scene):
-    def prime_factors(self, n):
-        i = 2
-        factors = []
-        while i * i <= n:
-            while n % i == 0:
-                factors.append(i)
-                n //= i
-            i += 1
-        if n > 1:
-            factors.append(n)
-        return factors
+from factorization import MILLER_RABIN_LIMIT, factorize
+from frame_dedup import HeldFrameScene
+from gcd_cache import load_factors, save_factors
+from gcd_lcm import euclid_steps, factor_terms, fit_row, join_numbers, plan_matching, power_tex
+from labels import math_label
+from tex_batch import BatchedTexScene
 
-    def construct(self):
-        FONT_SIZE = 24
+FONT_SIZE = 24
+COMMON_COLOR = YELLOW
+LCM_COLOR = ORANGE
+DIVISOR_COLOR = BLUE
+REMAINDER_COLOR = GREEN
+# Division rows kept on screen before the Euclidean chain scrolls up
+EUCLID_VISIBLE_ROWS = 6
+TOKEN_GAP = 0.1
+LINE_SPACING = 1.4
+# Factor rows stay above the point where matched factors combine
+FACTOR_ROWS_BOTTOM = 0.6
+FRAME_MARGIN = 0.3
 
-        x, y = 9,15
-        x_factors = self.prime_factors(x)
-        y_factors = self.prime_factors(y)
+FactorLayout = namedtuple("FactorLayout", "nums factor_rows gcf_label lcm_label gcf_row lcm_row gcf_width lcm_width")
 
-        COMMON_COLOR = YELLOW
-        X_COLOR = BLUE
-        Y_COLOR = GREEN
-        LCM_COLOR = ORANGE
+class GCDLCMAnimation(BatchedTexScene, HeldFrameScene):
+    numbers = (9, 15)
+    # One color per input column, so at most this many numbers
+    input_colors = (BLUE, GREEN, PURPLE, TEAL, MAROON, PINK, RED, GRAY)
+    # Seconds per number before large inputs are shown partly factored
+    factor_time_budget = 10.0
+    # Write each distinct prime once as a power instead of once per occurrence
+    group_exponents = False
+    # "factor" matches prime factors, "euclid" runs the Euclidean algorithm and
+    # "auto" matches factors only while every number is below factor_limit.
+    # The default covers the sieve, trial division and Pollard-Brent ranges up
+    # to where Miller-Rabin can still prove the factors prime.
+    method = "auto"
+    factor_limit = MILLER_RABIN_LIMIT
 
-        offset = 2.5
+    def prime_factors(self, n):
+        def report(found, remaining):
+            logger.info(f"Factoring {n}: found {found}, still splitting {remaining}")
+
+        factors = load_factors(n)
+        if factors is not None:
+            return factors
+        factors, complete = factorize(n, self.factor_time_budget, report)
+        if complete:
+            save_factors(n, factors)
+        else:
+            logger.warning(f"Could not finish factoring {n} in time or prove every factor prime; "
+                           f"showing the cofactors left as factors")
+        return factors
 
-        x_num = MathTex(str(x), color=X_COLOR, font_size=FONT_SIZE).move_to(UP * 1.7 + LEFT * offset)
-        y_num = MathTex(str(y), color=Y_COLOR, font_size=FONT_SIZE).move_to(UP * 1.7 + RIGHT * offset)
-        x_underline = Underline(x_num)
-        y_underline = Underline(y_num)
-        self.play(Write(x_num), Write(y_num), Create(x_underline), Create(y_underline))
+    def place_row(self, tokens, x, top, max_width, max_height, centered=False):
+        # Wraps and scales tokens into the box below top, left-aligned at x or
+        # centered on it, and returns them as one VGroup in order.
+        if not tokens:
+            return VGroup()
+        line_height = LINE_SPACING * max(t.height for t in tokens)
+        row = fit_row([t.width for t in tokens], line_height, max_width, max_height, TOKEN_GAP)
+        left = x - row.width / 2 if centered else x
+        for token, (dx, dy) in zip(tokens, row.positions):
+            token.scale(row.scale)
+            token.move_to([left + dx, top - row.scale * line_height / 2 - dy, 0], aligned_edge=LEFT)
+        return VGroup(*tokens)
 
-        x_factors_tex = MathTex(*[f"({n})" for n in x_factors], color=X_COLOR, font_size=FONT_SIZE).next_to(x_num, DOWN)
-        y_factors_tex = MathTex(*[f"({n})" for n in y_factors], color=Y_COLOR, font_size=FONT_SIZE).next_to(y_num, DOWN)
-        self.play(FadeIn(x_factors_tex), FadeIn(y_factors_tex))
+    def layout_factor_matching(self, numbers, term_lists, plan):
+        # Every position the factor-matching animation uses, computed before
+        # anything plays from the term counts and the measured token widths.
+        offset = 2.5
+        # Columns are 2 * offset apart for two numbers and close up to fit more
+        k = len(numbers)
+        spacing = min(2 * offset, (config.frame_width - 2) / (k - 1))
+        column_width = 0.9 * spacing
+        nums, factor_rows = [], []
+        for i, (n, terms, color) in enumerate(zip(numbers, term_lists, self.input_colors)):
+            cx = (i - (k - 1) / 2) * spacing
+            num = MathTex(str(n), color=color, font_size=FONT_SIZE).move_to(UP * 1.7 + RIGHT * cx)
+            if num.width > column_width:
+                num.scale_to_fit_width(column_width)
+            top = num.get_bottom()[1] - 0.3
+            tokens = [math_label(power_tex(p, e), font_size=FONT_SIZE, color=color) for p, e in terms]
+            factor_rows.append(self.place_row(tokens, cx, top, column_width, top - FACTOR_ROWS_BOTTOM, centered=True))
+            nums.append(num)
 
         gcf_label = MathTex("\\underline{\\mathrm{GCF}}", font_size=FONT_SIZE).move_to(DOWN * 1.7 + LEFT * offset)
         lcm_label = MathTex("\\underline{\\mathrm{LCM}}", font_size=FONT_SIZE).move_to(DOWN * 1.7 + RIGHT * offset)
+        # Row token 2s - 1 is the dot and 2s the power of the match in slot s
+        gcf_tokens = [math_label("(1)", font_size=FONT_SIZE, color=COMMON_COLOR)]
+        for match in plan.common:
+            gcf_tokens.append(math_label("\\cdot", font_size=FONT_SIZE, color=COMMON_COLOR))
+            gcf_tokens.append(math_label(power_tex(match.prime, match.gcf_exponent), font_size=FONT_SIZE, color=COMMON_COLOR))
+        lcm_tokens = [math_label("(1)", font_size=FONT_SIZE, color=LCM_COLOR)]
+        for match in plan.common + plan.lcm_only:
+            lcm_tokens.append(math_label("\\cdot", font_size=FONT_SIZE, color=LCM_COLOR))
+            lcm_tokens.append(math_label(power_tex(match.prime, match.lcm_exponent), font_size=FONT_SIZE, color=LCM_COLOR))
 
-        gcf_start = gcf_label.get_left() + DOWN * 0.8 + RIGHT * 0.1
-        lcm_start = lcm_label.get_left() + DOWN * 0.8 + RIGHT * 0.1
+        gcf_left = gcf_label.get_left()[0] + 0.1
+        lcm_left = lcm_label.get_left()[0] + 0.1
+        gcf_width = -FRAME_MARGIN - gcf_left
+        lcm_width = config.frame_width / 2 - FRAME_MARGIN - lcm_left
+        top = gcf_label.get_bottom()[1] - 0.4
+        height = top + config.frame_height / 2 - FRAME_MARGIN
+        gcf_row = self.place_row(gcf_tokens, gcf_left, top, gcf_width, height)
+        lcm_row = self.place_row(lcm_tokens, lcm_left, top, lcm_width, height)
+        return FactorLayout(nums, factor_rows, gcf_label, lcm_label, gcf_row, lcm_row, gcf_width, lcm_width)
 
-        gcf_val = MathTex("(1)", color=COMMON_COLOR, font_size=FONT_SIZE).move_to(gcf_start, aligned_edge=LEFT)
-        lcm_val = MathTex("(1)", color=LCM_COLOR, font_size=FONT_SIZE).move_to(lcm_start, aligned_edge=LEFT)
-        self.play(Write(gcf_label), Write(lcm_label), Write(gcf_val), Write(lcm_val))
+    def attach_factor(self, row, dot, token):
+        self.remove(dot, token)
+        row.add(dot, token)
+
+    def construct(self):
+        numbers = self.numbers
+        if not 2 <= len(numbers) <= len(self.input_colors):
+            raise ValueError(f"GCDLCMAnimation takes 2 to {len(self.input_colors)} numbers, got {len(numbers)}")
+        if self.method not in ("auto", "factor", "euclid"):
+            raise ValueError(f"Unknown GCDLCMAnimation method {self.method!r}")
+        if self.method == "euclid" or (self.method == "auto" and max(numbers) >= self.factor_limit):
+            gcf_value, lcm_value = self.play_euclid(numbers)
+        else:
+            gcf_value, lcm_value = self.play_factor_matching(numbers)
+
+        listed = join_numbers(numbers)
+        summary = Tex(
+            f"The GCF of {listed} is {gcf_value} and LCM of {listed} is {lcm_value}.",
+            font_size=FONT_SIZE
+        ).move_to(ORIGIN)
+        self.play(Write(summary))
+        self.wait(2)
+
+    def euclid_chain(self, a, b):
+        # Plays the divisions a = q * b + r down to a zero remainder, each
+        # divisor and remainder moving up into the next row, and leaves
+        # "gcd(a, b) = g" at the top of the frame.
+        title = MathTex(f"\\gcd({a}, {b})", font_size=FONT_SIZE).to_edge(UP)
+        self.play(Write(title))
+        steps = euclid_steps(a, b)
+        g = steps[-1][1] if steps else a
+        rows = VGroup()
+        for a_i, b_i, q, r in steps:
+            row = MathTex(str(a_i), "=", str(q), "\\cdot", str(b_i), "+", str(r), font_size=FONT_SIZE)
+            row[4].set_color(DIVISOR_COLOR)
+            row[6].set_color(REMAINDER_COLOR)
+            if not rows:
+                row.next_to(title, DOWN, buff=0.5)
+                self.play(Write(row))
+            else:
+                prev = rows[-1]
+                row.next_to(prev, DOWN)
+                row.shift((prev[1].get_x() - row[1].get_x()) * RIGHT)
+                if len(rows) == EUCLID_VISIBLE_ROWS:
+                    shift = prev.get_center() - row.get_center()
+                    self.play(FadeOut(rows[0]), rows[1:].animate.shift(shift), run_time=0.4)
+                    rows.remove(rows[0])
+                    row.shift(shift)
+                self.play(TransformFromCopy(prev[4], row[0]), TransformFromCopy(prev[6], row[4]), run_time=0.6)
+                self.play(*[Write(row[i]) for i in (1, 2, 3, 5, 6)], run_time=0.6)
+            rows.add(row)
+            self.wait(0.3)
+        result = MathTex(f"\\gcd({a}, {b}) = {g}", font_size=FONT_SIZE, color=COMMON_COLOR).move_to(title)
+        if rows:
+            self.play(Indicate(rows[-1][4], color=COMMON_COLOR))
+            self.play(FadeOut(rows), Transform(title, result))
+        else:
+            self.play(Transform(title, result))
+        self.wait(0.5)
+        return g, title
+
+    def play_euclid(self, numbers):
+        # Folds the numbers left to right: gcd(g, n) comes from one chain and
+        # lcm(l, n) = l * n / gcd(l, n), which needs a second chain once l and
+        # g differ. Steps grow with the logarithm of the numbers.
+        gcf_value = lcm_value = numbers[0]
+        for n in numbers[1:]:
+            gcf_next, gcd_line = self.euclid_chain(gcf_value, n)
+            if lcm_value == gcf_value:
+                lcm_gcd = gcf_next
+            else:
+                self.play(FadeOut(gcd_line))
+                lcm_gcd, gcd_line = self.euclid_chain(lcm_value, n)
+            lcm_next = lcm_value * n // lcm_gcd
+            lcm_line = MathTex(
+                f"\\mathrm{{lcm}}({lcm_value}, {n}) = \\frac{{{lcm_value} \\cdot {n}}}{{{lcm_gcd}}} = {lcm_next}",
+                font_size=FONT_SIZE, color=LCM_COLOR
+            ).next_to(gcd_line, DOWN, buff=0.5)
+            self.play(Write(lcm_line))
+            self.wait(1.0)
+            self.play(FadeOut(gcd_line), FadeOut(lcm_line))
+            gcf_value, lcm_value = gcf_next, lcm_next
+        return gcf_value, lcm_value
 
-        x_factors_list = list(x_factors)
-        y_factors_list = list(y_factors)
-        x_objs = [x_factors_tex[i] for i in range(len(x_factors_list))]
-        y_objs = [y_factors_tex[i] for i in range(len(y_factors_list))]
-        used_x = [False] * len(x_factors_list)
-        used_y = [False] * len(y_factors_list)
-        gcf_terms = ["(1)"]
-        lcm_terms = ["(1)"]
+    def play_factor_matching(self, numbers):
+        factors = {n: self.prime_factors(n) for n in set(numbers)}
+        term_lists = [factor_terms(factors[n], self.group_exponents) for n in numbers]
+        plan = plan_matching(term_lists)
+        layout = self.layout_factor_matching(numbers, term_lists, plan)
+
+        nums = layout.nums
+        underlines = [Underline(num) for num in nums]
+        self.play(*[Write(num) for num in nums], *[Create(line) for line in underlines])
+
+        factors_tex = layout.factor_rows
+        self.play(*[FadeIn(row) for row in factors_tex])
+
+        gcf_label, lcm_label = layout.gcf_label, layout.lcm_label
+        gcf_val = VGroup(layout.gcf_row[0])
+        lcm_val = VGroup(layout.lcm_row[0])
+        self.play(Write(gcf_label), Write(lcm_label), Write(gcf_val), Write(lcm_val))
 
         # Common factors animation
-        for i, xf in enumerate(x_factors_list):
-            for j, yf in enumerate(y_factors_list):
-                if xf == yf and not used_x[i] and not used_y[j]:
-                    self.play(
-                        x_objs[i].animate.set_color(COMMON_COLOR),
-                        y_objs[j].animate.set_color(COMMON_COLOR)
-                    )
-                    self.wait(0.1)
-                    combo_point = ORIGIN + UP*0.3
-                    x_copy = x_objs[i].copy()
-                    y_copy = y_objs[j].copy()
-                    self.play(
-                        x_copy.animate.move_to(combo_point),
-                        y_copy.animate.move_to(combo_point),
-                        run_time=0.7
-                    )
-                    combined = MathTex(f"({xf})", color=COMMON_COLOR, font_size=FONT_SIZE).move_to(combo_point)
-                    self.play(
-                        FadeOut(x_copy),
-                        FadeOut(y_copy),
-                        FadeIn(combined)
-                    )
-                    self.wait(0.1)
-                    gcf_target = gcf_start + RIGHT * (len(gcf_terms)) * 1.1
-                    lcm_target = lcm_start + RIGHT * (len(lcm_terms)) * 1.1
-                    combined_gcf = combined.copy().set_color(COMMON_COLOR)
-                    combined_lcm = combined.copy().set_color(LCM_COLOR)
-                    self.play(
-                        FadeOut(combined),
-                        combined_gcf.animate.move_to(gcf_target, aligned_edge=LEFT),
-                        combined_lcm.animate.move_to(lcm_target, aligned_edge=LEFT),
-                        FadeOut(x_objs[i]), FadeOut(y_objs[j])
-                    )
-                    self.wait(1.0)
-                    gcf_terms.append(f"({xf})")
-                    lcm_terms.append(f"({xf})")
-                    gcf_val_new = MathTex(" \\cdot ".join(gcf_terms), color=COMMON_COLOR, font_size=FONT_SIZE).move_to(gcf_start, aligned_edge=LEFT)
-                    lcm_val_new = MathTex(" \\cdot ".join(lcm_terms), color=LCM_COLOR, font_size=FONT_SIZE).move_to(lcm_start, aligned_edge=LEFT)
-                    self.play(
-                        FadeOut(combined_gcf),
-                        FadeOut(combined_lcm),
-                        Transform(gcf_val, gcf_val_new),
-                        Transform(lcm_val, lcm_val_new)
-                    )
-                    self.wait(0.1)
-                    used_x[i] = True
-                    used_y[j] = True
-                    break
-
-        # Leftover factors animated to LCM
-        for i, used in enumerate(used_x):
-            if not used:
-                obj = x_objs[i]
-                copy = obj.copy().set_color(LCM_COLOR)
-                lcm_target = lcm_start + RIGHT * (len(lcm_terms)) * 1.1
-                self.play(copy.animate.move_to(lcm_target, aligned_edge=LEFT), run_time=0.5)
-                self.wait(1.0)
-                lcm_terms.append(f"({x_factors_list[i]})")
-                lcm_val_new = MathTex(" \\cdot ".join(lcm_terms), color=LCM_COLOR, font_size=FONT_SIZE).move_to(lcm_start, aligned_edge=LEFT)
-                self.play(FadeOut(copy), FadeOut(obj), Transform(lcm_val, lcm_val_new))
-                self.wait(0.1)
-        for j, used in enumerate(used_y):
-            if not used:
-                obj = y_objs[j]
-                copy = obj.copy().set_color(LCM_COLOR)
-                lcm_target = lcm_start + RIGHT * (len(lcm_terms)) * 1.1
-                self.play(copy.animate.move_to(lcm_target, aligned_edge=LEFT), run_time=0.5)
-                self.wait(1.0)
-                lcm_terms.append(f"({y_factors_list[j]})")
-                lcm_val_new = MathTex(" \\cdot ".join(lcm_terms), color=LCM_COLOR, font_size=FONT_SIZE).move_to(lcm_start, aligned_edge=LEFT)
-                self.play(FadeOut(copy), FadeOut(obj), Transform(lcm_val, lcm_val_new))
-                self.wait(0.1)
+        for match in plan.common:
+            objs = [factors_tex[col][index] for col, index in match.members]
+            gcf_tex = power_tex(match.prime, match.gcf_exponent)
+            lcm_tex = power_tex(match.prime, match.lcm_exponent)
+            self.play(*[obj.animate.set_color(COMMON_COLOR) for obj in objs])
+            self.wait(0.1)
+            combo_point = ORIGIN + UP*0.3
+            copies = [obj.copy() for obj in objs]
+            self.play(*[c.animate.move_to(combo_point) for c in copies], run_time=0.7)
+            combined = math_label(gcf_tex, font_size=FONT_SIZE, color=COMMON_COLOR).move_to(combo_point)
+            self.play(*[FadeOut(c) for c in copies], FadeIn(combined))
+            self.wait(0.1)
+            gcf_dot, gcf_token = layout.gcf_row[2 * match.gcf_slot - 1:2 * match.gcf_slot + 1]
+            lcm_dot, lcm_token = layout.lcm_row[2 * match.lcm_slot - 1:2 * match.lcm_slot + 1]
+            combined_gcf = combined.copy()
+            # With grouped exponents the LCM keeps the largest power of the match
+            combined_lcm = math_label(lcm_tex, font_size=FONT_SIZE, color=LCM_COLOR).move_to(combo_point)
+            self.play(
+                FadeOut(combined),
+                combined_gcf.animate.move_to(gcf_token),
+                combined_lcm.animate.move_to(lcm_token),
+                *[FadeOut(obj) for obj in objs]
+            )
+            self.wait(1.0)
+            self.play(
+                FadeIn(gcf_dot), FadeIn(lcm_dot),
+                ReplacementTransform(combined_gcf, gcf_token),
+                ReplacementTransform(combined_lcm, lcm_token)
+            )
+            self.attach_factor(gcf_val, gcf_dot, gcf_token)
+            self.attach_factor(lcm_val, lcm_dot, lcm_token)
+            self.wait(0.1)
+
+        # Factors missing from some input only go to the LCM
+        for match in plan.lcm_only:
+            objs = [factors_tex[col][index] for col, index in match.members]
+            copies = [obj.copy().set_color(LCM_COLOR) for obj in objs]
+            lcm_dot, lcm_token = layout.lcm_row[2 * match.lcm_slot - 1:2 * match.lcm_slot + 1]
+            self.play(*[c.animate.move_to(lcm_token) for c in copies], run_time=0.5)
+            self.wait(1.0)
+            self.play(
+                *[FadeOut(obj) for obj in objs], *[FadeOut(c) for c in copies[1:]],
+                FadeIn(lcm_dot), ReplacementTransform(copies[0], lcm_token)
+            )
+            self.attach_factor(lcm_val, lcm_dot, lcm_token)
+            self.wait(0.1)
 
         # Fade out the top before solving GCF and LCM
         self.play(
-            FadeOut(x_num), FadeOut(y_num),
-            FadeOut(x_underline), FadeOut(y_underline),
-            FadeOut(x_factors_tex), FadeOut(y_factors_tex)
+            *[FadeOut(num) for num in nums],
+            *[FadeOut(line) for line in underlines],
+            *[FadeOut(row) for row in factors_tex]
         )
         self.wait(0.5)
 
         # Multiply out and show result (while GCF and LCM are still on screen)
-        gcf_value = 1
-        for t in gcf_terms[1:]:
-            gcf_value *= int(t.strip("()"))
-        lcm_value = 1
-        for t in lcm_terms[1:]:
-            lcm_value *= int(t.strip("()"))
-
-        gcf_solved = MathTex(str(gcf_value), color=COMMON_COLOR, font_size=FONT_SIZE).move_to(gcf_val, aligned_edge=LEFT)
-        lcm_solved = MathTex(str(lcm_value), color=LCM_COLOR, font_size=FONT_SIZE).move_to(lcm_val, aligned_edge=LEFT)
+        gcf_value = prod(match.prime ** match.gcf_exponent for match in plan.common)
+        lcm_value = prod(match.prime ** match.lcm_exponent for match in plan.common + plan.lcm_only)
+
+        gcf_solved = MathTex(str(gcf_value), color=COMMON_COLOR, font_size=FONT_SIZE)
+        lcm_solved = MathTex(str(lcm_value), color=LCM_COLOR, font_size=FONT_SIZE)
+        for solved, val, width in ((gcf_solved, gcf_val, layout.gcf_width), (lcm_solved, lcm_val, layout.lcm_width)):
+            if solved.width > width:
+                solved.scale_to_fit_width(width)
+            solved.move_to(val, aligned_edge=LEFT)
         self.play(
             Transform(gcf_val, gcf_solved),
             Transform(lcm_val, lcm_solved)
@@ -160,10 +288,4 @@ class GCDLCMAnimation(Scene):
             FadeOut(gcf_label), FadeOut(lcm_label),
         )
         self.wait(0.5)
-
-        summary = Tex(
-            f"The GCF of {x} and {y} is {gcf_value} and LCM of {x} and {y} is {lcm_value}.",
-            font_size=FONT_SIZE
-        ).move_to(ORIGIN)
-        self.play(Write(summary))
-        self.wait(2)
\ No newline at end of file
+        return gcf_value, lcm_value
@@ -0,0 +1,27 @@
+from manim import *
+
+
+class MobjectRegistry:
+    # Mobjects by role, so a stage can find what an earlier one made without
+    # scanning self.mobjects. A role names one mobject at a time.
+    def __init__(self):
+        self._by_role = {}
+
+    def register(self, role, mobject):
+        self._by_role[role] = mobject
+        return mobject
+
+    def pop(self, role, *default):
+        return self._by_role.pop(role, *default)
+
+
+class RegistryScene(Scene):
+    # Gives the scene a registry. List it before SectionCachedScene and add
+    # MobjectRegistry to snapshot_types so the registry is carried across
+    # section snapshots along with the mobjects it points to.
+    def setup(self):
+        super().setup()
+        self.registry = MobjectRegistry()
+
+    def register(self, role, mobject):
+        return self.registry.register(role, mobject)
\ No newline at end of file
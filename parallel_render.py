@@ -0,0 +1,74 @@
+from manim import *
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_utils import QUALITIES, concat_movies, load_scene_class
+
+
+def snapshot_sections(script, scene_name, quality, snapshot_dir):
+    # Run construct without rasterizing, pickling the scene state at every
+    # section boundary. Returns the section names in order.
+    scene_cls = load_scene_class(script, scene_name)
+    with tempconfig({"quality": quality, "dry_run": True}):
+        scene = scene_cls(skip_animations=True)
+        scene.snapshot_dir = snapshot_dir
+        scene.render()
+    return [name for name, _ in scene.section_keys]
+
+
+def render_section(script, scene_name, quality, snapshot_dir, index, section):
+    scene_cls = load_scene_class(script, scene_name)
+    output_file = f"{scene_name}_{index:02d}_{section}"
+    # Each section keeps its own partial movies and concat list, and nothing
+    # is evicted, so workers never delete or overwrite each other's files
+    partial_movie_dir = f"{{video_dir}}/partial_movie_files/{{scene_name}}/{output_file}"
+    with tempconfig({"quality": quality, "output_file": output_file,
+                     "partial_movie_dir": partial_movie_dir, "max_files_cached": -1}):
+        scene = scene_cls()
+        scene.snapshot_dir = snapshot_dir
+        scene.only_section = section
+        scene.render()
+        if section in scene.cached_sections:
+            return scene.cached_sections[section]
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def render_parallel(script, scene_name, quality="low_quality", jobs=None):
+    jobs = jobs or os.cpu_count()
+    with tempfile.TemporaryDirectory(prefix="snapshots_") as snapshot_dir:
+        sections = snapshot_sections(script, scene_name, quality, snapshot_dir)
+        logger.info(f"Rendering {len(sections)} sections on {jobs} workers")
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            futures = [
+                pool.submit(render_section, script, scene_name, quality, snapshot_dir, i, section)
+                for i, section in enumerate(sections)
+            ]
+            movies = [future.result() for future in futures]
+    # Not next to movies[0], which may be a movie in the section cache
+    with tempconfig({"quality": quality}):
+        video_dir = Path(config.get_dir("video_dir", module_name=Path(script).stem))
+    output = video_dir / f"{scene_name}{Path(movies[0]).suffix}"
+    return concat_movies(movies, output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render each section of a scene in its own process.")
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    output = render_parallel(args.script, args.scene, QUALITIES[args.quality], args.jobs)
+    print(f"{output} ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+from manim import *
+import argparse
+import hashlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.hashing import get_hash_from_play_call
+
+from dry_run import NullRenderer
+from render_utils import QUALITIES, load_scene_class
+
+VARIANTS = [
+    "needtofix.py",
+    "finishedfortonight_Version6.py",
+    "finishedfortonight.py",
+    "thisistheone.py",
+    "verynice_Version11.py",
+]
+SHARED_PARTIAL_MOVIE_DIR = "{media_dir}/videos/shared_prefix/{quality}/partial_movie_files"
+
+
+class SharedPrefixFileWriter(SceneFileWriter):
+    # Variants rendering at once share one partial movie directory, where
+    # manim would also write every variant's concat list under the same
+    # name. Each variant writes its list next to its own movie instead.
+    def combine_files(self, *args, **kwargs):
+        shared = self.partial_movie_directory
+        self.partial_movie_directory = self.movie_file_path.parent
+        try:
+            return super().combine_files(*args, **kwargs)
+        finally:
+            self.partial_movie_directory = shared
+
+
+class HashingRenderer(NullRenderer):
+    # Computes the same per-play hash manim's partial movie cache uses, without
+    # rendering anything.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hashes = []
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        compile_animation_data = scene.compile_animation_data
+
+        def compile_and_hash(*args, **kwargs):
+            result = compile_animation_data(*args, **kwargs)
+            self.hashes.append(get_hash_from_play_call(scene, self.camera, scene.animations, scene.mobjects))
+            return result
+
+        scene.compile_animation_data = compile_and_hash
+
+
+def play_path(script, scene_name, quality):
+    # Node ids of the variant's path through the render tree: node i stands for
+    # "the first i + 1 plays", so two variants share exactly their common prefix.
+    scene_cls = load_scene_class(script, scene_name)
+    with tempconfig({"quality": quality, "dry_run": True, "disable_caching": True}):
+        renderer = HashingRenderer()
+        scene_cls(renderer=renderer).render()
+    path = []
+    node = ""
+    for play_hash in renderer.hashes:
+        node = hashlib.sha256(f"{node}{play_hash}".encode()).hexdigest()
+        path.append(node)
+    return path
+
+
+def plan_waves(paths):
+    # Greedy schedule: a wave never holds two variants that would both render
+    # the same not-yet-rendered play, so every tree node is rendered once.
+    rendered = set()
+    remaining = sorted(paths, key=lambda script: -len(paths[script]))
+    waves = []
+    while remaining:
+        wave, claimed = [], set()
+        for script in remaining:
+            pending = set(paths[script]) - rendered
+            if not pending & claimed:
+                wave.append(script)
+                claimed |= pending
+        waves.append(wave)
+        rendered |= claimed
+        remaining = [script for script in remaining if script not in wave]
+    return waves
+
+
+def render_variant(script, scene_name, quality):
+    scene_cls = load_scene_class(script, scene_name)
+    writer_class = type(
+        "SharedPrefixFileWriter",
+        (SharedPrefixFileWriter, getattr(scene_cls, "file_writer_class", SceneFileWriter)),
+        {},
+    )
+    # Nothing is evicted from the shared directory: a variant has more plays
+    # than the default limit, and later waves reuse the earlier ones' movies
+    with tempconfig({"quality": quality, "partial_movie_dir": SHARED_PARTIAL_MOVIE_DIR, "max_files_cached": -1}):
+        scene = scene_cls(renderer=CairoRenderer(file_writer_class=writer_class))
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def render_tree(scripts, scene_name="Restart", quality="low_quality", jobs=None, plan_only=False):
+    paths = {script: play_path(script, scene_name, quality) for script in scripts}
+    total = sum(len(path) for path in paths.values())
+    unique = len({node for path in paths.values() for node in path})
+    for script, path in paths.items():
+        shared = max(
+            (sum(1 for a, b in zip(path, other) if a == b) for s, other in paths.items() if s != script),
+            default=0,
+        )
+        print(f"{script:34s} {len(path):4d} plays, {shared:4d} shared with another variant")
+    print(f"{unique} distinct plays out of {total} ({unique / total:.0%} of rendering every variant)")
+    waves = plan_waves(paths)
+    if plan_only:
+        for i, wave in enumerate(waves):
+            print(f"wave {i}: {', '.join(wave)}")
+        return []
+
+    movies = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        for wave in waves:
+            futures = [pool.submit(render_variant, script, scene_name, quality) for script in wave]
+            movies.extend(future.result() for future in futures)
+    return movies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render scene variants sharing their common prefix.")
+    parser.add_argument("scripts", nargs="*", default=VARIANTS)
+    parser.add_argument("--scene", default="Restart")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--plan-only", action="store_true", help="print the shared prefixes and render schedule")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    for movie in render_tree(args.scripts, args.scene, QUALITIES[args.quality], args.jobs, args.plan_only):
+        print(movie)
+    print(f"done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+from manim import *
+import argparse
+import json
+import time
+from collections import defaultdict
+
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from dry_run import calling_helper
+from render_utils import QUALITIES, load_scene_class
+
+PHASES = ("setup", "interpolation", "rasterization", "encoding")
+
+
+class ProfilingRenderer(CairoRenderer):
+    # Splits the wall time of every play/wait into phases. Whatever is not
+    # interpolation, rasterization or encoding is counted as setup
+    # (compiling animations, hashing, begin_animations).
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records = []
+        self._current = None
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self._time_method(scene, "update_to_time", "interpolation")
+        begin_animations = scene.begin_animations
+
+        # play_internal finishes every animation after its last frame; that
+        # is interpolation too, timed per animation once they have begun
+        def begin_and_time_finish(*args, **kwargs):
+            result = begin_animations(*args, **kwargs)
+            for animation in scene.animations or []:
+                self._time_method(animation, "finish", "interpolation")
+            return result
+
+        scene.begin_animations = begin_and_time_finish
+        self._time_method(self, "update_frame", "rasterization")
+        self._time_method(self, "get_frame", "rasterization")
+        self._time_method(self.file_writer, "begin_animation", "encoding")
+        self._time_method(self.file_writer, "end_animation", "encoding")
+        self._time_method(self.file_writer, "write_frame", "encoding", count_frames=True)
+
+    def _time_method(self, obj, name, phase, count_frames=False):
+        method = getattr(obj, name)
+
+        def timed(*args, **kwargs):
+            if self._current is None:
+                return method(*args, **kwargs)
+            if count_frames:
+                self._current["frames"] += kwargs.get("num_frames", args[1] if len(args) > 1 else 1)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._current[phase] += time.perf_counter() - start
+
+        setattr(obj, name, timed)
+
+    def play(self, scene, *args, **kwargs):
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._current["frames"] = 0
+        start = time.perf_counter()
+        try:
+            super().play(scene, *args, **kwargs)
+        finally:
+            total = time.perf_counter() - start
+            record, self._current = self._current, None
+        record["setup"] = max(0.0, total - sum(record[p] for p in PHASES[1:]))
+        animations = scene.animations or []
+        sections = getattr(self.file_writer, "sections", None)
+        record.update(
+            index=len(self.records),
+            kind="wait" if all(isinstance(a, Wait) for a in animations) else "play",
+            helper=calling_helper(scene),
+            section=sections[-1].name if sections else None,
+            duration=scene.duration,
+            skipped=self.skip_animations,
+            total=total,
+        )
+        self.records.append(record)
+
+
+def summarize(records, key):
+    groups = defaultdict(lambda: dict.fromkeys(PHASES + ("total",), 0.0) | {"plays": 0, "frames": 0})
+    for record in records:
+        group = groups[record[key] or "<construct>"]
+        for field in PHASES + ("total", "frames"):
+            group[field] += record[field]
+        group["plays"] += 1
+    return dict(groups)
+
+
+def profile(scene_cls, quality="low_quality", disable_caching=True):
+    writer_class = getattr(scene_cls, "file_writer_class", SceneFileWriter)
+    with tempconfig({"quality": quality, "disable_caching": disable_caching}):
+        renderer = ProfilingRenderer(file_writer_class=writer_class)
+        scene = scene_cls(renderer=renderer)
+        start = time.perf_counter()
+        scene.render()
+        wall_time = time.perf_counter() - start
+    records = renderer.records
+    return {
+        "scene": scene_cls.__name__,
+        "quality": quality,
+        "wall_time": wall_time,
+        "frames": sum(r["frames"] for r in records),
+        "by_helper": summarize(records, "helper"),
+        "by_section": summarize(records, "section"),
+        "plays": records,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every play/wait of a scene by phase.")
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-o", "--output", default="profile.json")
+    parser.add_argument("--use-cache", action="store_true", help="keep manim's partial movie cache enabled")
+    args = parser.parse_args()
+
+    scene_cls = load_scene_class(args.script, args.scene)
+    report = profile(scene_cls, QUALITIES[args.quality], disable_caching=not args.use_cache)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{report['scene']}: {report['wall_time']:.2f}s, {report['frames']} frames")
+    for helper, group in sorted(report["by_helper"].items(), key=lambda item: -item[1]["total"]):
+        phases = " ".join(f"{p}={group[p]:.2f}s" for p in PHASES)
+        print(f"  {helper:28s} {group['total']:7.2f}s  {phases}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import ast
+import importlib.util
+import inspect
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+FFMPEG = "ffmpeg"
+REPO_DIR = Path(__file__).resolve().parent
+
+
+def concat_movies(paths, output):
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    list_file = output.with_suffix(".txt")
+    list_file.write_text(
+        "".join(f"file '{Path(p).resolve().as_posix()}'\n" for p in paths),
+        encoding="utf-8",
+    )
+    try:
+        subprocess.run(
+            [FFMPEG, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", str(list_file), "-c", "copy", str(output)],
+            check=True,
+        )
+    finally:
+        list_file.unlink()
+    return output
+
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def output_name(name):
+    # Job names from batch files become output files: keep them to one plain
+    # file name, so "../x" or "a/b" cannot write outside the media directory
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("._")
+    if not name:
+        raise ValueError("the name has no usable characters")
+    return name
+
+
+def load_scene_class(script, scene_name):
+    script = Path(script).resolve()
+    if str(script.parent) not in sys.path:
+        sys.path.insert(0, str(script.parent))
+    spec = importlib.util.spec_from_file_location(script.stem, script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[script.stem] = module
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def _imported_modules(module):
+    for node in ast.walk(ast.parse(inspect.getsource(module))):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            yield node.module
+
+
+def local_modules(*names):
+    # The named modules plus every module of this repository they import,
+    # directly or not, sorted by name. Keys hashed from their sources change
+    # whenever code that shapes the output does.
+    found = {}
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        module = sys.modules.get(name)
+        path = getattr(module, "__file__", None)
+        if name in found or path is None:
+            continue
+        if name not in names and not Path(path).resolve().is_relative_to(REPO_DIR):
+            continue
+        found[name] = module
+        pending.extend(_imported_modules(module))
+    return [found[name] for name in sorted(found)]
+
+
+def local_sources(*names):
+    return [inspect.getsource(module) for module in local_modules(*names)]
@@ -0,0 +1,610 @@
+from manim import *
+import numpy as np
+
+from frame_dedup import HeldFrameFileWriter, HeldFrameScene
+from geometry import Construction, layout_of
+from label_placement import LabelPlacer, angle_candidates, edge_candidates
+from labels import math_label, text_label
+from mobject_registry import MobjectRegistry, RegistryScene
+from section_cache import SectionCachedFileWriter, SectionCachedScene
+from tex_batch import BatchedTexScene
+
+LABEL_FONT_SIZE = 48
+LABEL_FONT_SIZE_SMALL = 32
+DOT_RADIUS_M = 0.14
+SCALE_FACTOR = 0.5
+RIGHT_ANGLE_SIZE = 0.12
+INITIAL_RIGHT_ANGLE_SIZE = 0.28
+CIRCLE_COLOR = RED
+TRIANGLE_COLOR = BLUE
+BRACE_COLOR = YELLOW
+HIGHLIGHT_COLOR = YELLOW
+MH_LINE_COLOR = RED
+HN_LINE_COLOR = BLUE
+HIGHLIGHT_GREEN = GREEN
+EQ_FONT_SIZE = 36
+BOTTOM_FONT_SIZE = 18
+
+DEFAULT_TRIANGLE = (np.array([0, 0, 0]), np.array([-4, 0, 0]), np.array([0, 3, 0]))
+# Every segment of the finished diagram; labels keep clear of these even
+# before they are drawn
+DIAGRAM_EDGES = (("H", "M"), ("M", "L"), ("L", "H"), ("T", "N"), ("L", "T"), ("L", "N"))
+
+
+# Rules of the Restart construction. T and N end the diameter along line MH
+# of the circle about M through L, with N on the side of H.
+def circle_radius(M, L):
+    return layout_of(M=M, L=L).length("M", "L")
+
+
+def diameter_far(M, H, radius):
+    return M - radius * layout_of(M=M, H=H).unit("M", "H")
+
+
+def diameter_near(M, H, radius):
+    return M + radius * layout_of(M=M, H=H).unit("M", "H")
+
+
+def restart_construction(H, M, L):
+    construction = Construction(H=H, M=M, L=L)
+    construction.define("radius", circle_radius, "M", "L")
+    construction.define("T", diameter_far, "M", "H", "radius")
+    construction.define("N", diameter_near, "M", "H", "radius")
+    return construction
+
+
+class RestartFileWriter(SectionCachedFileWriter, HeldFrameFileWriter):
+    pass
+
+
+class RestartScene(RegistryScene, BatchedTexScene, SectionCachedScene, HeldFrameScene):
+    # Shared geometry and stages of the Restart proof. Variants set the two
+    # arrange_final switches and add their own sections after the shared ones.
+    fade_exterior_text = True
+    highlight_tln = True
+    # The right triangle (H, M, L), right-angled at H
+    triangle = DEFAULT_TRIANGLE
+    snapshot_types = SectionCachedScene.snapshot_types + (Construction, MobjectRegistry)
+    file_writer_class = RestartFileWriter
+
+    def run_shared_sections(self, H, M, L):
+        self.run_section("triangle", self.triangle_stage, H, M, L)
+        self.run_section("circle_and_diameter", self.circle_and_diameter_stage)
+        self.run_section("radius", self.radius_stage)
+        self.run_section("arrange_final", self.arrange_final_stage, self.fade_exterior_text, self.highlight_tln)
+
+    def layout(self):
+        # The geometry kernel over the named points where they stand now, so
+        # stages that see the same diagram share one cached layout
+        return layout_of(**{name: self.construction[name] for name in "HMLTN"})
+
+    def play_rescale(self, group, scale, target, **kwargs):
+        # Plays group scaling about its center onto target and moves the
+        # construction's points by the same map
+        center = group.get_center()
+        self.play(group.animate.scale(scale).move_to(target), **kwargs)
+        self.construction.apply(lambda points: (points - center) * scale + target)
+
+    def place_labels(self, placements):
+        # placements are (label, candidates) pairs in priority order. All of
+        # them are placed in one pass, clear of the diagram's segments, of
+        # what is on screen and of each other.
+        labels = {id(label) for label, _ in placements}
+        segments = [(self.construction[a], self.construction[b]) for a, b in DIAGRAM_EDGES]
+        boxes = []
+
+        def collect(mobject):
+            if id(mobject) in labels:
+                return
+            if isinstance(mobject, Line):
+                segments.append((mobject.get_start(), mobject.get_end()))
+            elif isinstance(mobject, Polygon):
+                # Its outline only: a filled triangle must not block labels inside it
+                vertices = mobject.get_vertices()
+                segments.extend(zip(vertices, np.roll(vertices, -1, axis=0)))
+            elif isinstance(mobject, (SingleStringMathTex, Text, Dot, Brace)):
+                boxes.append((mobject.get_left()[0], mobject.get_bottom()[1],
+                              mobject.get_right()[0], mobject.get_top()[1]))
+            else:
+                for submobject in mobject.submobjects:
+                    collect(submobject)
+
+        for mobject in self.mobjects:
+            collect(mobject)
+        centers = LabelPlacer(segments, boxes).place(
+            [(label.width, label.height, candidates) for label, candidates in placements]
+        )
+        for (label, _), center in zip(placements, centers):
+            label.move_to(center)
+
+    def triangle_stage(self, H, M, L):
+        self.construction = restart_construction(H, M, L)
+        triangle_group, dots, labels, triangle_lines = self.draw_triangle_and_labels(H, M, L)
+        self.dot_H, self.dot_M, self.dot_L = dots
+        self.label_H, self.label_M, self.label_L = labels
+        self.line_HM, self.line_ML, self.line_LH = triangle_lines
+
+        right_angle_mark = self.draw_right_angle_mark(H, M, L, size=INITIAL_RIGHT_ANGLE_SIZE)
+        self.play(FadeIn(right_angle_mark))
+        self.wait(1.2)
+
+        triangle_objects = VGroup(*triangle_group, right_angle_mark)
+        self.play_rescale(triangle_objects, SCALE_FACTOR, ORIGIN)
+        self.wait(1)
+        self.right_angle_mark = right_angle_mark
+
+    def circle_and_diameter_stage(self):
+        points = self.construction
+        new_H, new_M, new_L, radius = points["H"], points["M"], points["L"], points["radius"]
+        circle = self.register("circle", Circle(radius=radius, color=CIRCLE_COLOR).move_to(new_M))
+        self.play(Create(circle))
+        self.wait(1)
+
+        label_a, label_b, label_c, label_c_on_mn = self.label_triangle_sides(new_H, new_M, new_L)
+        self.play(FadeIn(label_a), FadeIn(label_b), FadeIn(label_c), FadeIn(label_c_on_mn))
+        self.wait(1)
+
+        diameter, dot_T, dot_N, label_T, label_N = self.draw_diameter_and_labels(points["T"], points["N"])
+        self.play(Create(diameter), FadeIn(dot_T), FadeIn(dot_N), FadeIn(label_T), FadeIn(label_N))
+        self.wait(1)
+
+        line_LT = Line(new_L, points["T"], color=WHITE)
+        line_LN = Line(new_L, points["N"], color=WHITE)
+        self.play(Create(line_LT), Create(line_LN))
+        self.wait(1)
+        right_angle_TLN = self.draw_right_angle_mark(new_L, points["T"], points["N"], size=RIGHT_ANGLE_SIZE)
+        self.play(FadeIn(right_angle_TLN))
+        self.wait(1)
+
+        explanation_line1 = VGroup(
+            MathTex(r"\angle TLN", font_size=28),
+            Text("is right because", font_size=24)
+        ).arrange(RIGHT, buff=0.15)
+        explanation_line2 = Text("it opens up to a semicircle.", font_size=24)
+        explanation = VGroup(explanation_line1, explanation_line2).arrange(DOWN, buff=0.15).next_to(right_angle_TLN, UP+RIGHT, buff=0.8)
+        self.play(FadeIn(explanation))
+        self.wait(1.7)
+        self.play(FadeOut(explanation))
+        self.wait(0.2)
+
+        self.new_H, self.new_M, self.new_L = new_H, new_M, new_L
+        self.label_a, self.label_b, self.label_c, self.label_c_on_mn = label_a, label_b, label_c, label_c_on_mn
+        self.diameter, self.dot_T, self.dot_N, self.label_T, self.label_N = diameter, dot_T, dot_N, label_T, label_N
+        self.line_LT, self.line_LN, self.right_angle_TLN = line_LT, line_LN, right_angle_TLN
+
+    def radius_stage(self):
+        points = self.construction
+        self.c_dup, self.brace, self.c_above_brace = self.mark_and_label_radius(
+            points["L"], points["M"], points["T"], points["N"], self.label_c, points["M"], points["N"]
+        )
+
+    def arrange_final_stage(self, fade_exterior_text, highlight_tln):
+        self.remain_group = VGroup(
+            self.dot_H, self.label_H, self.dot_M, self.label_M, self.dot_L, self.label_L,
+            self.line_HM, self.line_ML, self.line_LH, self.right_angle_mark,
+            self.label_a, self.label_b, self.label_c, self.label_c_on_mn,
+            self.diameter, self.dot_T, self.dot_N, self.label_T, self.label_N,
+            self.line_LT, self.line_LN, self.right_angle_TLN,
+            self.c_dup, self.brace, self.c_above_brace
+        )
+
+        self.diagram_bottom = self.arrange_final(
+            self.remain_group, self.dot_M, self.dot_H, self.dot_N, self.label_a, self.label_c_on_mn,
+            self.c_above_brace, self.brace, self.diameter, self.new_H, self.new_M, self.new_L,
+            self.dot_L, self.dot_N, self.line_LN, self.label_a, self.line_HM, self.dot_T,
+            self.label_c, self.c_dup, self.line_ML, self.dot_T, self.dot_L, self.dot_M, self.label_c,
+            fade_exterior_text=fade_exterior_text, highlight_tln=highlight_tln
+        )
+
+    def tm_mh_th_stage(self):
+        dot_M = self.dot_M
+        c_dup, label_a, label_M = self.c_dup, self.label_a, self.label_M
+
+        T_pos, H_pos, M_pos = (self.construction[name] for name in "THM")
+
+        # 1. Draw brace under dot T and dot H (across T and H), in yellow
+        brace_th = BraceBetweenPoints(T_pos, H_pos, direction=DOWN, color=BRACE_COLOR)
+        self.play(Create(brace_th))
+        self.wait(0.4)
+
+        # 2. TM on the diagram turns blue
+        line_TM = Line(T_pos, M_pos, color=HN_LINE_COLOR, stroke_width=10)
+        self.play(Create(line_TM))
+        self.wait(0.2)
+
+        # 3. MH on the diagram turns red
+        line_MH = Line(M_pos, H_pos, color=MH_LINE_COLOR, stroke_width=10)
+        self.play(Create(line_MH))
+        self.wait(0.2)
+
+        # 4. Equation at bottom: TM (blue) + MH (red) = TH (white)
+        eq_tm = math_label("TM", font_size=EQ_FONT_SIZE, color=HN_LINE_COLOR)
+        eq_plus = text_label("+", font_size=EQ_FONT_SIZE, color=WHITE)
+        eq_mh = math_label("MH", font_size=EQ_FONT_SIZE, color=MH_LINE_COLOR)
+        eq_eq = text_label("=", font_size=EQ_FONT_SIZE, color=WHITE)
+        eq_th = math_label("TH", font_size=EQ_FONT_SIZE, color=WHITE)
+        eq_group = VGroup(eq_tm, eq_plus, eq_mh, eq_eq, eq_th).arrange(RIGHT, buff=0.18)
+        eq_group.next_to(brace_th, DOWN, buff=1.1)
+        self.play(FadeIn(eq_group))
+        self.wait(0.4)
+
+        # Use c_dup for TM, not label_c!
+        c_dup.generate_target()
+        c_dup.target.move_to(eq_tm.get_center())
+        c_dup.target.set_color(HN_LINE_COLOR)
+        c_dup.target.scale(EQ_FONT_SIZE / LABEL_FONT_SIZE_SMALL)
+        label_a.generate_target()
+        label_a.target.move_to(eq_mh.get_center())
+        label_a.target.set_color(MH_LINE_COLOR)
+        label_a.target.scale(EQ_FONT_SIZE / LABEL_FONT_SIZE_SMALL)
+        self.play(
+            FadeOut(eq_tm),
+            FadeOut(eq_mh),
+            MoveToTarget(c_dup),
+            MoveToTarget(label_a)
+        )
+        eq_group.submobjects[0] = c_dup
+        eq_group.submobjects[2] = label_a
+        self.wait(0.4)
+
+        # The letter M on the diagram disappears
+        self.play(FadeOut(label_M))
+        self.wait(0.2)
+        # The dot at M disappears
+        self.play(FadeOut(dot_M))
+        self.wait(0.2)
+
+        # Both TM and MH lines turn white
+        self.play(
+            line_TM.animate.set_color(WHITE),
+            line_MH.animate.set_color(WHITE)
+        )
+        self.wait(0.2)
+
+        # Place c+a at the middle of the brace, slightly below the brace
+        brace_mid = brace_th.get_center()
+        ca_label = math_label("c+a", font_size=EQ_FONT_SIZE, color=WHITE).move_to(brace_mid + DOWN * 0.35)
+        self.play(FadeIn(ca_label))
+        self.wait(0.5)
+
+        # Fade out the brace
+        self.play(FadeOut(brace_th))
+        self.wait(0.3)
+
+        # Find c-a label's y position (where arrange_final placed it)
+        c_minus_a_y = self.c_minus_a_label.get_center()[1]
+
+        # Move c+a to be vertically aligned with c-a
+        ca_label.generate_target()
+        ca_label.target.move_to([ca_label.get_center()[0], c_minus_a_y, 0])
+        self.play(MoveToTarget(ca_label))
+        self.wait(0.5)
+
+        # Fade out the equation (but NOT the c+a label)
+        self.play(FadeOut(eq_group))
+        self.wait(0.3)
+        self.ca_label = ca_label
+
+    def tln_stage(self):
+        self.highlight_tln_and_label_y(self.remain_group)
+
+    def draw_triangle_and_labels(self, H, M, L):
+        dot_H = Dot(H, color=WHITE)
+        dot_M = Dot(M, color=RED, radius=DOT_RADIUS_M)
+        dot_L = Dot(L, color=WHITE)
+        label_H = text_label("H", font_size=LABEL_FONT_SIZE).next_to(dot_H, direction=DOWN+LEFT, buff=0.25)
+        label_M = text_label("M", font_size=LABEL_FONT_SIZE).next_to(dot_M, DOWN)
+        label_L = text_label("L", font_size=LABEL_FONT_SIZE).next_to(dot_L, UP)
+        self.play(FadeIn(dot_H), FadeIn(label_H))
+        self.wait(0.5)
+        self.play(FadeIn(dot_M), FadeIn(label_M))
+        self.wait(0.5)
+        self.play(FadeIn(dot_L), FadeIn(label_L))
+        self.wait(0.5)
+        line_HM = Line(H, M, color=TRIANGLE_COLOR)
+        line_ML = Line(M, L, color=TRIANGLE_COLOR)
+        line_LH = Line(L, H, color=TRIANGLE_COLOR)
+        self.play(Create(line_HM)); self.wait(0.3)
+        self.play(Create(line_ML)); self.wait(0.3)
+        self.play(Create(line_LH)); self.wait(0.3)
+        return [dot_H, dot_M, dot_L, label_H, label_M, label_L, line_HM, line_ML, line_LH], (dot_H, dot_M, dot_L), (label_H, label_M, label_L), (line_HM, line_ML, line_LH)
+
+    def label_triangle_sides(self, H, M, L):
+        geometry = layout_of(H=H, M=M, L=L)
+        label_a = math_label("a", font_size=LABEL_FONT_SIZE_SMALL)
+        label_b = math_label("b", font_size=LABEL_FONT_SIZE_SMALL)
+        label_c = math_label("c", font_size=LABEL_FONT_SIZE_SMALL)
+        self.place_labels([
+            (label_a, edge_candidates(geometry, "H", "M", side=1)),
+            (label_b, edge_candidates(geometry, "L", "H", side=-1)),
+            (label_c, edge_candidates(geometry, "M", "L", side=1)),
+        ])
+        label_c_on_mn = math_label("c", font_size=LABEL_FONT_SIZE_SMALL).move_to(label_c)
+        label_c_on_mn.set_z_index(3)
+        return label_a, label_b, label_c, label_c_on_mn
+
+    def draw_diameter_and_labels(self, left, right):
+        diameter = Line(left, right, color=WHITE)
+        dot_T = Dot(left, color=WHITE)
+        dot_N = Dot(right, color=WHITE)
+        label_T = text_label("T", font_size=int(LABEL_FONT_SIZE * SCALE_FACTOR)).next_to(dot_T, LEFT)
+        label_N = text_label("N", font_size=int(LABEL_FONT_SIZE * SCALE_FACTOR)).next_to(dot_N, RIGHT)
+        return diameter, dot_T, dot_N, label_T, label_N
+
+    def draw_right_angle_mark(self, A, B, C, size=RIGHT_ANGLE_SIZE):
+        corners = layout_of(A=A, B=B, C=C).right_angle("A", "B", "C", size)
+        return Polygon(*corners, color=WHITE, fill_opacity=0.7).set_fill(WHITE, opacity=0.7)
+
+    def mark_and_label_radius(self, L, M, T, N, label_c, M_actual, N_actual):
+        lm_text = Text("LM is a radius.", font_size=LABEL_FONT_SIZE_SMALL).move_to(L + np.array([2.8, 1.0, 0]))
+        self.play(FadeIn(lm_text))
+        self.wait(1)
+        circ_c = Circle(0.26, color=HIGHLIGHT_COLOR).move_to(label_c.get_center())
+        self.play(Create(circ_c)); self.wait(0.7)
+        self.play(FadeOut(lm_text), FadeOut(circ_c)); self.wait(0.3)
+
+        tm_text = Text("TM is a radius.", font_size=LABEL_FONT_SIZE_SMALL).move_to(L + np.array([2.8, 1.0, 0]))
+        self.play(FadeIn(tm_text)); self.wait(1)
+
+        c_dup = math_label("c", font_size=LABEL_FONT_SIZE_SMALL)
+        self.place_labels([(c_dup, edge_candidates(layout_of(M=M, T=T), "M", "T", side=1))])
+        self.add(c_dup)
+        self.wait(1)
+        self.play(FadeOut(tm_text))
+        self.wait(0.7)
+
+        mn_text = Text("and MN is a radius.", font_size=LABEL_FONT_SIZE_SMALL).move_to(L + np.array([2.8, 1.0, 0]))
+        self.play(FadeIn(mn_text)); self.wait(1)
+        brace = BraceBetweenPoints(M_actual, N_actual, direction=UP, color=BRACE_COLOR)
+        self.play(Create(brace)); self.wait(0.7)
+        lm_mid = (L + M) / 2
+        c_brace = label_c.copy().move_to(lm_mid)
+        self.play(c_brace.animate.move_to(brace.get_center() + UP * 0.4))
+        self.wait(1)
+        self.play(FadeOut(mn_text)); self.wait(0.5)
+        circle = self.registry.pop("circle", None)
+        if circle is not None:
+            self.play(FadeOut(circle))
+            self.wait(0.5)
+        return c_dup, brace, c_brace
+
+    def arrange_final(
+        self, remain_group, dot_M, dot_H, dot_N, label_a, label_c_on_mn, c_above_brace, brace,
+        diameter, new_H, new_M, new_L, dot_L, dot_N_real, line_LN, label_a_obj, line_HM, dot_T,
+        label_c, c_dup, line_ML, dot_T_obj, dot_L_obj, dot_M_obj, label_c_lm,
+        fade_exterior_text=True, highlight_tln=True
+    ):
+        frame_width = config.frame_width if hasattr(config, "frame_width") else 14.222
+        frame_height = config.frame_height if hasattr(config, "frame_height") else 8.0
+        target_width = frame_width * 0.65
+        scale_needed = target_width / remain_group.width
+        up_shift = frame_height * 0.25
+        self.play_rescale(remain_group, scale_needed, UP * up_shift, run_time=1)
+        self.wait(1)
+
+        eq_mh = math_label("MH", font_size=EQ_FONT_SIZE, color=HN_LINE_COLOR)
+        eq_plus = text_label("+", font_size=EQ_FONT_SIZE, color=WHITE)
+        eq_hn = math_label("HN", font_size=EQ_FONT_SIZE, color=MH_LINE_COLOR)
+        eq_eq = text_label("=", font_size=EQ_FONT_SIZE, color=WHITE)
+        eq_mn = math_label("MN", font_size=EQ_FONT_SIZE, color=WHITE)
+        eq_group = VGroup(eq_mh, eq_plus, eq_hn, eq_eq, eq_mn).arrange(RIGHT, buff=0.18)
+        eq_group.move_to([0, -0.4, 0])
+        self.play(FadeIn(eq_group))
+        self.wait(0.5)
+
+        points = self.construction
+        M_pos, H_pos, N_pos = points["M"], points["H"], points["N"]
+        mn_line = Line(M_pos, N_pos, color=WHITE, stroke_width=6)
+        self.add(mn_line)
+        mh_line = Line(M_pos, H_pos, color=HN_LINE_COLOR, stroke_width=10)
+        hn_line = Line(H_pos, N_pos, color=MH_LINE_COLOR, stroke_width=10)
+        self.play(Create(mh_line), Create(hn_line))
+        self.wait(0.2)
+
+        label_a_fly = label_a.copy().scale(1.1).set_color(HN_LINE_COLOR)
+        label_a_fly.save_state()
+        label_a_fly.generate_target()
+        label_a_fly.target.move_to(eq_mh)
+        self.play(MoveToTarget(label_a_fly), FadeOut(eq_mh))
+        self.wait(0.2)
+
+        circ_c = Circle(0.32, color=HIGHLIGHT_COLOR).move_to(c_above_brace.get_center())
+        self.play(Create(circ_c))
+        self.wait(0.3)
+
+        self.play(FadeOut(eq_mn))
+        self.play(FadeOut(circ_c))
+        c_above_brace.save_state()
+        self.play(c_above_brace.animate.move_to(eq_mn.get_center()))
+        self.wait(0.2)
+
+        self.play(FadeOut(brace))
+        self.wait(0.3)
+
+        self.remove(eq_group, eq_mh, eq_mn, eq_plus, eq_hn, eq_eq)
+
+        equation_a = label_a_fly
+        equation_plus = text_label("+", font_size=EQ_FONT_SIZE, color=WHITE)
+        equation_hn = math_label("HN", font_size=EQ_FONT_SIZE, color=MH_LINE_COLOR)
+        equation_eq = text_label("=", font_size=EQ_FONT_SIZE, color=WHITE)
+        equation_c = c_above_brace
+        equation_group = VGroup(equation_a, equation_plus, equation_hn, equation_eq, equation_c).arrange(RIGHT, buff=0.18)
+        equation_group.move_to([0, -0.4, 0])
+        self.add(equation_group)
+        self.wait(0.6)
+
+        hn_eq = math_label("HN", "=", "c - a", font_size=LABEL_FONT_SIZE_SMALL)
+        hn_eq[2].set_color(HIGHLIGHT_COLOR)
+        hn_eq.next_to(equation_group, DOWN, buff=0.3)
+        self.play(FadeIn(hn_eq))
+        self.wait(0.7)
+
+        # c-a and the angle labels still to come are placed together, so none
+        # of them lands on another whatever the triangle
+        two_x_label_color = YELLOW
+        c_minus_a_label = math_label("c\\!-\!a", font_size=LABEL_FONT_SIZE_SMALL, color=WHITE)
+        two_x_label = math_label("2x", font_size=LABEL_FONT_SIZE_SMALL, color=two_x_label_color)
+        q1 = math_label("?", font_size=LABEL_FONT_SIZE_SMALL, color=two_x_label_color)
+        q2 = math_label("?", font_size=LABEL_FONT_SIZE_SMALL, color=two_x_label_color)
+        geometry = self.layout()
+        self.place_labels([
+            (c_minus_a_label, edge_candidates(geometry, "H", "N", side=-1)),
+            (two_x_label, angle_candidates(geometry, "M", "L", "N")),
+            (q1, angle_candidates(geometry, "T", "L", "M")),
+            (q2, angle_candidates(geometry, "L", "T", "M")),
+        ])
+        self.c_minus_a_label = c_minus_a_label
+        self.play(FadeIn(c_minus_a_label))
+        self.wait(1.0)
+
+        self.play(
+            equation_a.animate.set_color(WHITE),
+            equation_hn.animate.set_color(WHITE)
+        )
+        self.wait(0.6)
+
+        self.play(FadeOut(line_HM))
+        self.wait(0.5)
+
+        self.play(mh_line.animate.set_color(WHITE))
+        self.wait(0.2)
+
+        self.play(hn_line.animate.set_color(WHITE))
+        self.wait(0.2)
+
+        self.play(FadeOut(equation_group), FadeOut(hn_eq))
+        self.wait(0.5)
+
+        everything = VGroup(remain_group)
+        diagram_bottom = everything.get_bottom()
+
+        # Place "Let's let ..." line (fixed: LMH instead of LHM)
+        instruction = MathTex(
+            r"\text{Let's let}\ \angle LMH = 2x", font_size=LABEL_FONT_SIZE_SMALL
+        ).next_to(diagram_bottom, DOWN, buff=0.7)
+        self.play(Write(instruction))
+        self.wait(0.8)
+
+        # Show the 2x label inside angle LMH
+        L_pos, T_pos = points["L"], points["T"]
+        self.play(FadeIn(two_x_label))
+        self.wait(1.0)
+
+        self.play(FadeOut(instruction))
+        self.wait(0.5)
+
+        # Highlight TL, LM, MT in green
+        tl_line = Line(T_pos, L_pos, color=HIGHLIGHT_GREEN, stroke_width=10)
+        lm_line = Line(L_pos, M_pos, color=HIGHLIGHT_GREEN, stroke_width=10)
+        mt_line = Line(M_pos, T_pos, color=HIGHLIGHT_GREEN, stroke_width=10)
+        self.play(Create(tl_line), Create(lm_line), Create(mt_line))
+        self.wait(0.3)
+
+        # Isosceles/theorem lines
+        isosceles_text = MathTex(
+            r"\triangle TLM\ \text{ is isosceles because } \overline{TM} \cong \overline{LM}.",
+            font_size=LABEL_FONT_SIZE_SMALL, color=WHITE
+        ).move_to(diagram_bottom + DOWN * 0.7)
+        self.play(Write(isosceles_text))
+        self.wait(0.8)
+
+        theorem_text = MathTex(
+            r"\text{According to the isosceles triangle theorem,}\ "
+            r"\angle T \cong \angle TLM.",
+            font_size=LABEL_FONT_SIZE_SMALL, color=WHITE
+        ).next_to(isosceles_text, DOWN, buff=0.5)
+        self.play(Write(theorem_text))
+        self.wait(1.0)
+
+        # Now show the question marks
+        self.play(FadeIn(q1), FadeIn(q2))
+        self.wait(1.2)
+
+        # Fade out both lines simultaneously
+        self.play(FadeOut(isosceles_text), FadeOut(theorem_text))
+        self.wait(0.5)
+
+        # Exterior Angle Theorem text (only once)
+        exterior_text = VGroup(
+            Text("According to the Exterior Angle Theorem...", font_size=LABEL_FONT_SIZE_SMALL),
+            Text("They must have the same value and add to 2x.", font_size=LABEL_FONT_SIZE_SMALL),
+            Text("So they must both be x.", font_size=LABEL_FONT_SIZE_SMALL)
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
+        exterior_text.move_to(diagram_bottom + DOWN * 0.7)
+        self.play(FadeIn(exterior_text))
+        self.wait(1.8)
+
+        x1 = math_label("x", font_size=LABEL_FONT_SIZE_SMALL, color=two_x_label_color).move_to(q1.get_center())
+        x2 = math_label("x", font_size=LABEL_FONT_SIZE_SMALL, color=two_x_label_color).move_to(q2.get_center())
+        self.play(Transform(q1, x1), Transform(q2, x2))
+        self.wait(1.0)
+
+        if fade_exterior_text:
+            self.play(FadeOut(exterior_text))
+            self.wait(0.4)
+
+        # Fade out LM (green), LM (triangle), c on LM, q2, and 2x (c label is NOT colored green)
+        self.play(
+            FadeOut(lm_line),      # Green LM segment
+            FadeOut(line_ML),      # Triangle's original LM segment (blue)
+            FadeOut(label_c),      # c label on LM (never colored green)
+            FadeOut(q2),           # x at q2
+            FadeOut(two_x_label),  # 2x label
+            FadeOut(label_c_on_mn)
+        )
+        self.wait(0.4)
+
+        if highlight_tln:
+            self.highlight_tln_and_label_y(remain_group)
+
+        everything = VGroup(remain_group)
+        diagram_bottom = everything.get_bottom()
+        return diagram_bottom
+
+    def highlight_tln_and_label_y(self, remain_group):
+        T, L, N = (self.construction[name] for name in "TLN")
+
+        # Create filled triangle and outline for TLN
+        tln_fill = Polygon(T, L, N, color=TRIANGLE_COLOR, fill_color=TRIANGLE_COLOR, fill_opacity=0.0)
+        tln_fill.set_z_index(-1)
+        self.add(tln_fill)
+        tln_outline = VGroup(
+            Line(T, L, color=WHITE),
+            Line(L, N, color=WHITE),
+            Line(N, T, color=WHITE)
+        )
+        self.add(*tln_outline)
+
+        for _ in range(2):
+            self.play(
+                tln_fill.animate.set_fill(color=TRIANGLE_COLOR, opacity=0.6),
+                *[l.animate.set_color(TRIANGLE_COLOR) for l in tln_outline]
+            )
+            self.wait(0.5)
+            self.play(
+                tln_fill.animate.set_fill(opacity=0.0),
+                *[l.animate.set_color(WHITE) for l in tln_outline]
+            )
+            self.wait(0.5)
+
+        # === VGroup with words and 'y' at angle N ===
+
+        # Place text in the exact same spot as "According to the..." (i.e., exterior_text)
+        everything = VGroup(remain_group)
+        diagram_bottom = everything.get_bottom()
+        tln_vgroup_pos = diagram_bottom + DOWN * 0.7
+        tln_text1 = Text("This triangle has 180 degrees.", font_size=LABEL_FONT_SIZE_SMALL)
+        tln_text2 = Text("Therefore, angle N must be 90 - x degrees.", font_size=LABEL_FONT_SIZE_SMALL)
+        tln_text3 = Text("For simplicity, let's call it y.", font_size=LABEL_FONT_SIZE_SMALL)
+        tln_vgroup = VGroup(tln_text1, tln_text2, tln_text3).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
+        tln_vgroup.move_to(tln_vgroup_pos)
+        self.play(FadeIn(tln_vgroup))
+        self.wait(1.2)
+
+        # Place "y" inside angle N, clear of the other labels
+        y_label = math_label("y", font_size=LABEL_FONT_SIZE_SMALL, color=YELLOW)
+        self.place_labels([(y_label, angle_candidates(self.layout(), "N", "L", "T"))])
+        self.play(FadeIn(y_label))
+        self.wait(1.0)
+
+# By Hamiltonmath
\ No newline at end of file
@@ -0,0 +1,207 @@
+from manim import *
+import hashlib
+import inspect
+import pickle
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from render_utils import concat_movies, local_modules
+
+SECTION_CACHE_DIRNAME = "section_cache"
+
+_SELF_CALL = re.compile(r"self\.(\w+)\(")
+_CONSTANT = re.compile(r"\b([A-Z][A-Z0-9_]+)\b")
+
+
+def section_cache_dir():
+    return Path(config.get_dir("media_dir")) / SECTION_CACHE_DIRNAME
+
+
+def _update_with_value(hasher, value):
+    if isinstance(value, np.ndarray):
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _update_with_value(hasher, item)
+    else:
+        hasher.update(repr(value).encode())
+
+
+def scene_fingerprint(mobjects):
+    hasher = hashlib.sha256()
+    for mob in mobjects:
+        for m in mob.get_family():
+            hasher.update(type(m).__name__.encode())
+            hasher.update(np.ascontiguousarray(m.points).tobytes())
+            hasher.update(str(m.get_color()).encode())
+            hasher.update(repr(m.z_index).encode())
+            for attr in ("fill_rgbas", "stroke_rgbas"):
+                rgbas = getattr(m, attr, None)
+                if rgbas is not None:
+                    hasher.update(np.ascontiguousarray(rgbas).tobytes())
+    return hasher.hexdigest()
+
+
+def stage_source(scene, stage):
+    # The stage itself plus every scene method it reaches through self.<name>(...)
+    sources = []
+    seen = set()
+    pending = [stage.__name__]
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        func = getattr(type(scene), name, None)
+        if not inspect.isfunction(func):
+            continue
+        source = inspect.getsource(func)
+        sources.append(source)
+        pending.extend(_SELF_CALL.findall(source))
+    return sources
+
+
+@lru_cache
+def helper_sources(scene_cls):
+    # What stages reach outside the scene's methods: the module-level
+    # functions of the modules the scene classes are defined in, such as
+    # construction rules, and the whole of every other repository module
+    # they import, such as the label placer
+    scene_modules = {cls.__module__ for cls in scene_cls.__mro__}
+    sources = []
+    for module in local_modules(scene_cls.__module__):
+        if module.__name__ not in scene_modules:
+            sources.append(inspect.getsource(module))
+            continue
+        for name, value in sorted(vars(module).items()):
+            if inspect.isfunction(value) and value.__module__ == module.__name__:
+                sources.append(inspect.getsource(value))
+    return tuple(sources)
+
+
+class SectionCachedFileWriter(SceneFileWriter):
+    # A cached section plays nothing, so its movie is only in its section's
+    # list; the flat partial_movie_files list stays indexed by num_plays.
+    # The scene movie is therefore joined from the sections, in order.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (section, movie) pairs for the sections rendered afresh
+        self.sections_to_cache = []
+
+    def combine_to_movie(self):
+        flat = self.partial_movie_files
+        self.partial_movie_files = [movie for section in self.sections for movie in section.partial_movie_files]
+        try:
+            super().combine_to_movie()
+        finally:
+            self.partial_movie_files = flat
+        self.cache_sections()
+
+    def cache_sections(self):
+        # finish() cleans the partial movie cache right after combining, and
+        # a long scene overflows max_files_cached, so every section is stored
+        # before that while all of its parts are still on disk
+        for section, movie in self.sections_to_cache:
+            parts = [p for p in section.partial_movie_files if p is not None]
+            if parts and all(Path(p).exists() for p in parts):
+                concat_movies(parts, movie)
+        self.sections_to_cache = []
+
+
+class SectionCachedScene(Scene):
+    # Set by parallel_render: write a state snapshot before every section, or
+    # resume from one and render just that section.
+    snapshot_dir = None
+    only_section = None
+    # Attributes of these types set by stages are carried across snapshots
+    snapshot_types = (Mobject, np.ndarray)
+    file_writer_class = SectionCachedFileWriter
+
+    def __init__(self, *args, **kwargs):
+        if kwargs.get("renderer") is None:
+            kwargs["renderer"] = CairoRenderer(
+                file_writer_class=self.file_writer_class,
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(*args, **kwargs)
+
+    def setup(self):
+        super().setup()
+        self.section_keys = []
+        # Movies of the sections this render took from the cache, by name
+        self.cached_sections = {}
+        self._base_attrs = set(vars(self))
+
+    def snapshot_path(self, name):
+        return Path(self.snapshot_dir) / f"{name}.pkl"
+
+    def save_snapshot(self, name):
+        state = {
+            "mobjects": self.mobjects,
+            "foreground_mobjects": self.foreground_mobjects,
+            "section_keys": self.section_keys,
+            "attrs": {
+                k: v for k, v in vars(self).items()
+                if k not in self._base_attrs and isinstance(v, self.snapshot_types)
+            },
+        }
+        path = self.snapshot_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore_snapshot(self, name):
+        with open(self.snapshot_path(name), "rb") as f:
+            state = pickle.load(f)
+        self.mobjects = state["mobjects"]
+        self.foreground_mobjects = state["foreground_mobjects"]
+        self.section_keys = state["section_keys"]
+        for k, v in state["attrs"].items():
+            setattr(self, k, v)
+
+    def section_key(self, name, stage, inputs):
+        hasher = hashlib.sha256()
+        hasher.update(name.encode())
+        previous = self.section_keys[-1][1] if self.section_keys else ""
+        hasher.update(previous.encode())
+        sources = stage_source(self, stage)
+        for source in sources + list(helper_sources(type(self))):
+            hasher.update(source.encode())
+        constants = sorted({c for source in sources for c in _CONSTANT.findall(source)})
+        for constant in constants:
+            if constant in stage.__globals__:
+                hasher.update(constant.encode())
+                _update_with_value(hasher, stage.__globals__[constant])
+        _update_with_value(hasher, inputs)
+        hasher.update(scene_fingerprint(self.mobjects).encode())
+        for option in ("pixel_width", "pixel_height", "frame_rate", "background_color", "movie_file_extension"):
+            hasher.update(repr(config[option]).encode())
+        return hasher.hexdigest()[:32]
+
+    def run_section(self, name, stage, *inputs):
+        if self.only_section is not None:
+            if name != self.only_section:
+                return None
+            self.restore_snapshot(name)
+        elif self.snapshot_dir is not None:
+            self.save_snapshot(name)
+        key = self.section_key(name, stage, inputs)
+        self.section_keys.append((name, key))
+        writer = self.renderer.file_writer
+        caching = (config.write_to_movie and not config.disable_caching
+                   and isinstance(writer, SectionCachedFileWriter))
+        movie = section_cache_dir() / f"{key}{config.movie_file_extension}"
+        cached = caching and movie.exists()
+        self.next_section(name, skip_animations=cached)
+        if cached:
+            logger.info(f"Section {name}: using cached movie {movie.name}")
+            writer.sections[-1].partial_movie_files.append(str(movie))
+            self.cached_sections[name] = str(movie)
+        elif caching:
+            writer.sections_to_cache.append((writer.sections[-1], movie))
+        return stage(*inputs)
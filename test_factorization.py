@@ -0,0 +1,74 @@
+import math
+import time
+
+import pytest
+
+import factorization
+
+# Two 25-digit primes; Pollard-Brent needs far longer than any budget here
+HARD_SEMIPRIME = 1000000000000000000000007 * 1000000000000000000000049
+
+
+def test_smallest_prime_factors_match_trial_division():
+    spf = factorization.smallest_prime_factors(2000)
+    for n in range(2, 2001):
+        assert spf[n] == next(p for p in range(2, n + 1) if n % p == 0)
+
+
+def test_prime_factors_on_both_sides_of_the_sieve_limit():
+    factorization.clear_cache()
+    factorization.set_sieve_limit(1000)
+    try:
+        assert factorization.prime_factors(360) == [2, 2, 2, 3, 3, 5]
+        # Wheel trial division down to the sieve, then the sieve finishes
+        assert factorization.prime_factors(1009 * 1013 * 12) == [2, 2, 3, 1009, 1013]
+    finally:
+        factorization.set_sieve_limit(factorization.DEFAULT_SIEVE_LIMIT)
+        factorization.clear_cache()
+
+
+@pytest.mark.parametrize("n, expected", [
+    (2, True), (97, True), (561, False), (2 ** 61 - 1, True),
+    # Strong pseudoprime to the first 12 prime bases
+    (318665857834031151167461, False),
+])
+def test_is_probable_prime(n, expected):
+    assert factorization.is_probable_prime(n) == expected
+
+
+@pytest.mark.parametrize("factors", [
+    [2, 2, 3, 5],
+    [999983, 1000003],
+    [399165290221, 798330580441],
+    [3, 3, 1000000007, 2305843009213693951],
+])
+def test_factorize_products(factors):
+    factorization.clear_cache()
+    assert factorization.factorize(math.prod(factors), 10) == (sorted(factors), True)
+
+
+def test_factorize_reports_factors_it_cannot_prove_prime():
+    factorization.clear_cache()
+    prime = 2 ** 89 - 1
+    assert factorization.factorize(prime) == ([prime], False)
+    assert prime not in factorization._cache
+    # Strong pseudoprime to all 13 bases, the first number they cannot settle
+    pseudoprime = factorization.MILLER_RABIN_LIMIT
+    assert factorization.is_probable_prime(pseudoprime)
+    assert factorization.factorize(pseudoprime, 0.5)[1] is False
+
+
+def test_pollard_brent_keeps_to_its_deadline():
+    factorization.clear_cache()
+    start = time.monotonic()
+    assert factorization.factorize(HARD_SEMIPRIME, time_budget=0.5) == ([HARD_SEMIPRIME], False)
+    # The deadline is checked every m steps of the inner loops
+    assert time.monotonic() - start < 0.5 + 0.1
+
+
+def test_incomplete_factorizations_are_not_repeated_within_their_budget():
+    factorization.clear_cache()
+    assert factorization.factorize(HARD_SEMIPRIME, 0.3) == ([HARD_SEMIPRIME], False)
+    start = time.monotonic()
+    assert factorization.factorize(HARD_SEMIPRIME, 0.3) == ([HARD_SEMIPRIME], False)
+    assert time.monotonic() - start < 0.05
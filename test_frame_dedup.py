@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import *
+
+from frame_dedup import HeldFrameScene
+
+
+class Hold(HeldFrameScene):
+    def construct(self):
+        self.add(Square())
+        self.wait(1)
+
+
+def test_held_frames_render_in_a_dry_run(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path), "dry_run": True}):
+        Hold().render()
+
+
+def test_held_frames_are_written_as_images_for_png_output(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path), "quality": "low_quality", "frame_rate": 5,
+                     "format": "png"}):
+        Hold().render()
+    assert len(list(tmp_path.rglob("*.png"))) == 5
@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from gcd_batch import read_jobs
+
+
+def test_jsonl_jobs_are_validated_row_by_row(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("\n".join([
+        "[15, 9]",
+        '{"numbers": [12, 18, 30], "name": "three", "group_exponents": true}',
+        "[7]",
+        "[4, 0]",
+        "[4, 2.5]",
+        "[4, true]",
+        '{"numbers": [4, 6], "colour": "red"}',
+        "not json",
+        "[" + ", ".join(["2"] * 9) + "]",
+        "[8, 12]",
+    ]), encoding="utf-8")
+    jobs = list(read_jobs(path))
+    assert [job.get("numbers") for job in jobs if "error" not in job] == [[9, 15], [12, 18, 30], [8, 12]]
+    assert jobs[0]["name"] == "GCDLCM_9_15"
+    assert jobs[1]["name"] == "three" and jobs[1]["options"] == {"group_exponents": True}
+    assert [job["row"] for job in jobs if "error" in job] == [f"{path}:{n}" for n in range(3, 10)]
+
+
+def test_csv_header_is_read_only_when_it_names_a_job_column(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("name,a,b,group_exponents\n../first,12,18,yes\n,20,8,\n", encoding="utf-8")
+    jobs = list(read_jobs(path))
+    assert jobs[0] == {"name": "first", "numbers": [12, 18], "options": {"group_exponents": True},
+                       "row": f"{path}:2"}
+    assert jobs[1]["numbers"] == [8, 20] and jobs[1]["options"] == {}
+
+    path.write_text("a,b\n12,18\n", encoding="utf-8")
+    first, second = read_jobs(path)
+    assert "error" in first and second["numbers"] == [12, 18]
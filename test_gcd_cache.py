@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import *
+
+import gcd_cache
+from render_utils import load_scene_class
+
+SCENE_CLS = load_scene_class("manim_gcd_lcm_animation_Version24.py", "GCDLCMAnimation")
+
+
+def test_canonical_numbers_ignore_order():
+    assert gcd_cache.canonical_numbers([15, 9, 12]) == gcd_cache.canonical_numbers((9, 12, 15)) == (9, 12, 15)
+
+
+def test_cache_key_depends_on_everything_but_the_order_of_the_numbers():
+    key = gcd_cache.cache_key(SCENE_CLS, [15, 9], {}, "low_quality")
+    assert gcd_cache.cache_key(SCENE_CLS, [9, 15], {}, "low_quality") == key
+    assert gcd_cache.cache_key(SCENE_CLS, [9, 16], {}, "low_quality") != key
+    assert gcd_cache.cache_key(SCENE_CLS, [15, 9], {"group_exponents": True}, "low_quality") != key
+    assert gcd_cache.cache_key(SCENE_CLS, [15, 9], {}, "high_quality") != key
+
+
+def test_stored_entries_are_found_until_their_video_is_gone(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        movie = tmp_path / "render.mp4"
+        movie.write_bytes(b"video")
+        key = gcd_cache.cache_key(SCENE_CLS, [15, 9], {}, "low_quality")
+        assert gcd_cache.lookup(key) is None
+        output = gcd_cache.store(key, [15, 9], {}, "low_quality", movie)
+        entry = gcd_cache.lookup(key)
+        assert entry["output"] == output and (entry["gcd"], entry["lcm"]) == (3, 45)
+        assert entry["numbers"] == [9, 15]
+        Path(output).unlink()
+        assert gcd_cache.lookup(key) is None
+
+
+def test_factors_are_stored_only_above_the_sieve(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        assert gcd_cache.STORED_FACTOR_MIN <= 1_000_001 < 10 * gcd_cache.STORED_FACTOR_MIN
+        gcd_cache.save_factors(360, [2, 2, 2, 3, 3, 5])
+        gcd_cache.save_factors(1_000_001, [101, 9901])
+        assert gcd_cache.load_factors(360) is None
+        assert gcd_cache.load_factors(1_000_001) == [101, 9901]
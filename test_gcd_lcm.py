@@ -0,0 +1,69 @@
+import math
+import random
+from functools import reduce
+
+import pytest
+
+import factorization
+from gcd_lcm import MIN_ROW_SCALE, Match, euclid_steps, factor_terms, fit_row, plan_matching
+
+
+def test_plan_matching_pairs_equal_primes_in_order():
+    # 12 = 2 * 2 * 3 and 18 = 2 * 3 * 3
+    plan = plan_matching([factor_terms([2, 2, 3]), factor_terms([2, 3, 3])])
+    assert plan.common == [
+        Match(2, [(0, 0), (1, 0)], 1, 1, 1, 1),
+        Match(3, [(0, 2), (1, 1)], 1, 1, 2, 2),
+    ]
+    assert plan.lcm_only == [
+        Match(2, [(0, 1)], 0, 1, None, 3),
+        Match(3, [(1, 2)], 0, 1, None, 4),
+    ]
+
+
+def test_plan_matching_gives_gcd_and_lcm_of_lists():
+    rng = random.Random(0)
+    for _ in range(200):
+        numbers = [rng.randrange(2, 5000) for _ in range(rng.randrange(2, 6))]
+        group_exponents = rng.random() < 0.5
+        term_lists = [factor_terms(factorization.prime_factors(n), group_exponents) for n in numbers]
+        plan = plan_matching(term_lists)
+        gcf = math.prod(m.prime ** m.gcf_exponent for m in plan.common)
+        lcm = math.prod(m.prime ** m.lcm_exponent for m in plan.common + plan.lcm_only)
+        assert gcf == reduce(math.gcd, numbers)
+        assert lcm == reduce(math.lcm, numbers)
+        members = sorted(member for m in plan.common + plan.lcm_only for member in m.members)
+        assert members == sorted((k, i) for k, terms in enumerate(term_lists) for i in range(len(terms)))
+
+
+def test_euclid_steps():
+    steps = euclid_steps(252, 105)
+    assert all(a == q * b + r for a, b, q, r in steps)
+    assert steps[-1][3] == 0 and steps[-1][1] == 21
+
+
+def test_euclid_steps_grow_with_the_logarithm():
+    # Consecutive Fibonacci numbers are the worst case: one step per term
+    a, b = 1, 1
+    for _ in range(80):
+        a, b = a + b, a
+    assert len(euclid_steps(a, b)) == 80
+    assert len(euclid_steps(a, b)) <= 5 * len(str(b))
+
+
+def test_fit_row_wraps_and_shrinks_to_the_box():
+    row = fit_row([1.0] * 10, line_height=1.0, max_width=3.5, max_height=3.0, gap=0.1)
+    assert row.width <= 3.5
+    lines = {dy for _, dy in row.positions}
+    assert (len(lines) - 1) * row.scale + row.scale <= 3.0 + 1e-9
+
+
+def test_fit_row_keeps_a_short_row_whole():
+    row = fit_row([1.0, 1.0], line_height=1.0, max_width=10.0, max_height=3.0, gap=0.5)
+    assert row.scale == 1.0 and row.width == pytest.approx(2.5)
+    assert row.positions == [(0.0, 0.0), (1.5, 0.0)]
+
+
+def test_fit_row_stops_shrinking_at_the_minimum_scale():
+    row = fit_row([5.0] * 50, line_height=1.0, max_width=1.0, max_height=1.0, gap=0.1)
+    assert MIN_ROW_SCALE <= row.scale < MIN_ROW_SCALE / 0.9
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from geometry import Construction, layout_of
+
+
+def test_layout_normals_and_bisectors():
+    layout = layout_of(H=[0, 0, 0], M=[-4, 0, 0], L=[0, 3, 0])
+    assert layout.length("M", "L") == pytest.approx(5)
+    assert np.allclose(layout.normal("H", "M"), [0, -1, 0])
+    assert np.allclose(layout.bisector("H", "M", "L"), [-np.sqrt(0.5), np.sqrt(0.5), 0])
+
+
+def test_layouts_are_shared_and_read_only():
+    layout = layout_of(H=[0, 0, 0], M=[-4, 0, 0], L=[0, 3, 0])
+    assert layout_of(H=np.zeros(3), M=(-4.0, 0.0, 0.0), L=[0, 3, 0]) is layout
+    assert np.allclose(layout.anchor("H", "M", 0.5), [-2, -0.5, 0])
+    assert np.allclose(layout.right_angle("H", "M", "L", 0.2)[2], [-0.2, 0.2, 0])
+    with pytest.raises(ValueError):
+        layout.points[0, 0] = 1
+
+
+def test_construction_recomputes_only_downstream_points():
+    calls = []
+
+    def midpoint(a, b):
+        calls.append("mid")
+        return (a + b) / 2
+
+    construction = Construction(A=[0, 0, 0], B=[2, 0, 0], C=[0, 4, 0])
+    construction.define("AB", midpoint, "A", "B")
+    construction.define("AC", lambda a, c: (a + c) / 2, "A", "C")
+    assert list(construction["AB"]) == [1, 0, 0]
+    construction["AB"]
+    assert calls == ["mid"]
+    construction.move(C=[0, 6, 0])
+    construction["AB"]
+    assert calls == ["mid"]
+    assert list(construction["AC"]) == [0, 3, 0]
+
+
+def test_construction_apply_moves_every_free_point():
+    construction = Construction(A=[0, 0, 0], B=[2, 0, 0])
+    construction.define("M", lambda a, b: (a + b) / 2, "A", "B")
+    construction.define("N", lambda m, b: (m + b) / 2, "M", "B")
+    assert list(construction["N"]) == [1.5, 0, 0]
+    construction.apply(lambda points: points * 2 + [0, 1, 0])
+    assert list(construction["A"]) == [0, 1, 0]
+    assert list(construction["N"]) == [3, 1, 0]
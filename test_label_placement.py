@@ -0,0 +1,23 @@
+from label_placement import LabelPlacer, SpatialGrid, boxes_overlap, segment_hits_box
+
+
+def test_segment_and_box_collisions():
+    assert segment_hits_box((0, 0), (1, 1), (0.4, 0.4, 0.6, 0.6))
+    assert not segment_hits_box((0, 0), (1, 1), (0.4, 0.6, 0.5, 0.7))
+    assert not segment_hits_box((0, 0), (1, 0), (0.2, 0.1, 0.3, 0.3))
+    assert boxes_overlap((0, 0, 1, 1), (0.5, 0.5, 2, 2))
+    assert not boxes_overlap((0, 0, 1, 1), (1.5, 0, 2, 1))
+
+
+def test_spatial_grid_finds_items_in_touched_cells():
+    grid = SpatialGrid(cell=1.0)
+    grid.insert((0.1, 0.1, 0.4, 0.4), "near")
+    grid.insert((5.0, 5.0, 6.0, 6.0), "far")
+    assert grid.query((0.0, 0.0, 0.5, 0.5)) == {"near"}
+
+
+def test_label_placer_keeps_labels_apart_and_off_segments():
+    placer = LabelPlacer(segments=[((-2, 0), (2, 0))])
+    candidates = [(0, 0), (0, 0.3), (0, -0.3), (0, 0.6)]
+    first, second = placer.place([(0.3, 0.2, candidates), (0.3, 0.2, candidates)])
+    assert first == (0, 0.3) and second == (0, -0.3)
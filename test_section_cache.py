@@ -0,0 +1,60 @@
+import shutil
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import *
+
+from section_cache import SectionCachedScene, section_cache_dir
+
+PLAYS_PER_SECTION = 55
+
+
+class TwoSections(SectionCachedScene):
+    step = 0.01
+
+    def construct(self):
+        self.dot = Dot()
+        self.add(self.dot)
+        self.run_section("first", self.shift_dot, PLAYS_PER_SECTION)
+        self.run_section("second", self.shift_dot, PLAYS_PER_SECTION)
+
+    def shift_dot(self, plays):
+        for _ in range(plays):
+            self.play(self.dot.animate.shift(RIGHT * self.step), run_time=0.2)
+
+
+class LongerFirstSection(TwoSections):
+    def construct(self):
+        self.dot = Dot()
+        self.add(self.dot)
+        self.run_section("first", self.shift_dot, PLAYS_PER_SECTION + 1)
+        self.run_section("second", self.shift_dot, PLAYS_PER_SECTION)
+
+
+def test_section_keys_chain_on_the_previous_section(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path), "dry_run": True}):
+        keys = []
+        for scene_cls in (TwoSections, LongerFirstSection):
+            scene = scene_cls(skip_animations=True)
+            scene.render()
+            keys.append(dict(scene.section_keys))
+    assert keys[0]["first"] != keys[1]["first"]
+    # Same stage and inputs, but it follows a different first section
+    assert keys[0]["second"] != keys[1]["second"]
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg")
+def test_sections_are_cached_when_the_scene_overflows_the_partial_movie_cache(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path), "quality": "low_quality", "frame_rate": 5,
+                     "max_files_cached": 100}):
+        scene = TwoSections()
+        scene.render()
+        movies = [section_cache_dir() / f"{key}{config.movie_file_extension}" for _, key in scene.section_keys]
+        assert 2 * PLAYS_PER_SECTION > 100
+        assert all(movie.exists() for movie in movies)
+
+        again = TwoSections()
+        again.render()
+        assert set(again.cached_sections) == {"first", "second"}
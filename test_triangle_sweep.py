@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from triangle_sweep import read_triangles
+
+
+def test_rejected_rows_are_kept_and_the_rest_still_read(tmp_path):
+    path = tmp_path / "triangles.csv"
+    path.write_text("\n".join([
+        "0,0,-4,0,0,3",
+        "0,0,-4,0,1,3",
+        "0,0,-4,0",
+        "0,0,x,0,0,3",
+        "0,0,0,0,0,3",
+        "0,0,-4,0,0,3,../../escape",
+        "0,0,-4,0,0,3,",
+    ]), encoding="utf-8")
+    first, skew, short, text, degenerate, named, unnamed = read_triangles(path)
+    assert first == {"name": "Restart_0_0_-4_0_0_3", "H": [0.0, 0.0], "M": [-4.0, 0.0], "L": [0.0, 3.0],
+                     "row": f"{path}:1"}
+    assert all("error" in row for row in (skew, short, text, degenerate))
+    assert skew["row"] == f"{path}:2"
+    assert named["name"] == "escape"
+    assert unnamed["name"] == first["name"]
+
+
+def test_jsonl_rows_need_three_points(tmp_path):
+    path = tmp_path / "triangles.jsonl"
+    path.write_text('{"H": [0, 0], "M": [0, 2]}\n[1, 2]\n{"H": [1, 1], "M": [1, 3], "L": [4, 1], "name": "a b"}\n',
+                    encoding="utf-8")
+    missing, listed, triangle = read_triangles(path)
+    assert "error" in missing and "error" in listed
+    assert triangle["name"] == "a_b"
@@ -0,0 +1,182 @@
+from manim import *
+import hashlib
+import json
+import os
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.utils.tex_file_writing import generate_tex_file
+
+from dry_run import NullRenderer
+from labels import clear_label_cache
+from render_utils import local_sources
+
+BATCH_PAGE_ENV = "texbatchpage"
+PLACEHOLDER_MAX_PATHS = 64
+DVI_FORMATS = (".dvi", ".xdv")
+
+_DOCUMENTCLASS = re.compile(r"\\documentclass\[([^\]]*)\]\{standalone\}")
+_collecting = False
+
+
+def _placeholder_svg(expression, directory):
+    # Stand-in SVG so construct can keep going while tex strings are collected.
+    # One square per visible character keeps submobject indexing in range.
+    count = min(PLACEHOLDER_MAX_PATHS, max(1, len(expression.replace(" ", ""))))
+    path = Path(directory) / f"placeholder_{count}.svg"
+    if not path.exists():
+        squares = "".join(f'<path d="M{2 * i} 0h1v1h-1z"/>' for i in range(count))
+        path.write_text(
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {2 * count} 1">{squares}</svg>',
+            encoding="utf-8",
+        )
+    return path
+
+
+def _scene_parameters(scene_cls):
+    # Class attributes that parametrize construct, such as the numbers of a
+    # GCD/LCM job, so subclasses that only change them get their own manifest.
+    parameters = {}
+    for cls in reversed(scene_cls.__mro__):
+        for name, value in vars(cls).items():
+            if not name.startswith("_") and isinstance(value, (bool, int, float, str, tuple)):
+                parameters[name] = repr(value)
+    return sorted(parameters.items())
+
+
+def _manifest_path(scene_cls):
+    # Variant scripts are thin subclasses, so the tex strings mostly live in
+    # the modules their bases come from and those modules' helpers
+    sources = local_sources(scene_cls.__module__)
+    digest = hashlib.sha256(f"{sources}{_scene_parameters(scene_cls)}".encode()).hexdigest()[:16]
+    return Path(config.get_dir("tex_dir")) / f"batch_{scene_cls.__name__}_{digest}.json"
+
+
+def collect_tex(scene_cls):
+    # Run construct without rendering and record every tex_to_svg_file call.
+    global _collecting
+    requests = []
+    complete = False
+    original = tex_mobject.tex_to_svg_file
+    with tempfile.TemporaryDirectory(prefix="tex_placeholders_") as directory:
+        def record(expression, environment=None, tex_template=None):
+            requests.append((expression, environment, tex_template))
+            return _placeholder_svg(expression, directory)
+
+        tex_mobject.tex_to_svg_file = record
+        _collecting = True
+        try:
+            with tempconfig({"dry_run": True}):
+                scene_cls(skip_animations=True).render()
+            complete = True
+        except Exception as exc:
+            logger.warning(f"Tex collection for {scene_cls.__name__} stopped early: {exc!r}")
+        finally:
+            _collecting = False
+            tex_mobject.tex_to_svg_file = original
+            # Labels built during collection hold placeholder paths
+            clear_label_cache()
+    return requests, complete
+
+
+def _split_document(text):
+    preamble, rest = text.split("\\begin{document}", 1)
+    body = rest.rsplit("\\end{document}", 1)[0]
+    return preamble, body.strip()
+
+
+def _compile_command(compiler, output_format, tex_file, tex_dir):
+    command = [compiler, "-interaction=batchmode", "-halt-on-error", f"-output-directory={tex_dir}"]
+    if compiler == "xelatex":
+        command.append("-no-pdf")
+    elif compiler in ("latex", "pdflatex", "lualatex"):
+        command.append(f"-output-format={output_format[1:]}")
+    return command + [str(tex_file)]
+
+
+def compile_batch(compiler, output_format, preamble, tex_files):
+    # Compile every pending expression as one page of a single document, then
+    # split the output into the per-expression SVGs manim looks for.
+    if output_format not in DVI_FORMATS or not _DOCUMENTCLASS.search(preamble):
+        return 0
+    tex_dir = Path(config.get_dir("tex_dir"))
+    bodies = [_split_document(f.read_text(encoding="utf-8"))[1] for f in tex_files]
+    preamble = _DOCUMENTCLASS.sub(
+        lambda m: f"\\documentclass[{m.group(1)},multi={BATCH_PAGE_ENV}]{{standalone}}", preamble, count=1
+    )
+    pages = "".join(f"\\begin{{{BATCH_PAGE_ENV}}}\n{body}\n\\end{{{BATCH_PAGE_ENV}}}\n" for body in bodies)
+    document = (
+        f"{preamble}\\newenvironment{{{BATCH_PAGE_ENV}}}{{}}{{}}\n"
+        f"\\begin{{document}}\n{pages}\\end{{document}}\n"
+    )
+    # Per process: concurrent batch workers may compile the same document,
+    # and each only ever renames finished SVGs into place
+    name = f"batch_{hashlib.sha256(document.encode()).hexdigest()[:16]}_{os.getpid()}"
+    batch_tex = tex_dir / f"{name}.tex"
+    batch_tex.write_text(document, encoding="utf-8")
+    dvi = batch_tex.with_suffix(output_format)
+    try:
+        subprocess.run(_compile_command(compiler, output_format, batch_tex, tex_dir), check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        subprocess.run(
+            ["dvisvgm", "--page=1-", "--no-fonts", "--verbosity=0",
+             f"--output={tex_dir / name}-%4p.svg", str(dvi)],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError) as exc:
+        logger.warning(f"Batched tex compile failed, falling back to per-string compiles: {exc!r}")
+        return 0
+    finally:
+        if not config.no_latex_cleanup:
+            for suffix in (".tex", ".aux", ".log", output_format):
+                batch_tex.with_suffix(suffix).unlink(missing_ok=True)
+    page_files = [tex_dir / f"{name}-{i:04d}.svg" for i in range(1, len(tex_files) + 1)]
+    if not all(page.exists() for page in page_files):
+        logger.warning("Batched tex compile produced the wrong number of pages, ignoring it")
+        for page in tex_dir.glob(f"{name}-*.svg"):
+            page.unlink()
+        return 0
+    for page, tex_file in zip(page_files, tex_files):
+        os.replace(page, tex_file.with_suffix(".svg"))
+    return len(tex_files)
+
+
+def prefill_tex_cache(scene_cls):
+    manifest = _manifest_path(scene_cls)
+    if manifest.exists():
+        requests = [(e, env, None) for e, env in json.loads(manifest.read_text(encoding="utf-8"))]
+    else:
+        requests, complete = collect_tex(scene_cls)
+        if complete and all(template is None for _, _, template in requests):
+            partial = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+            partial.write_text(json.dumps([[e, env] for e, env, _ in requests]), encoding="utf-8")
+            os.replace(partial, manifest)
+
+    groups = {}
+    for expression, environment, template in requests:
+        template = template or config.tex_template
+        tex_file = generate_tex_file(expression, environment, template)
+        if tex_file.with_suffix(".svg").exists():
+            continue
+        preamble, _ = _split_document(tex_file.read_text(encoding="utf-8"))
+        key = (template.tex_compiler, template.output_format, preamble)
+        groups.setdefault(key, {})[tex_file] = None
+
+    compiled = sum(
+        compile_batch(compiler, output_format, preamble, list(tex_files))
+        for (compiler, output_format, preamble), tex_files in groups.items()
+    )
+    if compiled:
+        logger.info(f"Compiled {compiled} tex strings for {scene_cls.__name__} in one batch")
+
+
+class BatchedTexScene(Scene):
+    def setup(self):
+        super().setup()
+        # Dry runs and hashing passes rasterize nothing, so they skip the
+        # extra construct pass that collecting the tex strings costs
+        if not _collecting and not isinstance(self.renderer, NullRenderer):
+            prefill_tex_cache(type(self))
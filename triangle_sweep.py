@@ -0,0 +1,138 @@
+from manim import *
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from render_utils import QUALITIES, load_scene_class, output_name
+
+SCRIPT = "needtofix.py"
+SCENE = "Restart"
+# |HM . HL| relative to |HM| |HL| allowed for a right angle at H
+RIGHT_ANGLE_TOLERANCE = 1e-6
+
+_scene_cls = None
+
+
+def _triangle(H, M, L, name, where):
+    if any(len(p) != 2 for p in (H, M, L)):
+        raise ValueError("each of H, M and L needs two coordinates")
+    H, M, L = (np.array([float(p[0]), float(p[1]), 0.0]) for p in (H, M, L))
+    if not all(np.isfinite(p).all() for p in (H, M, L)):
+        raise ValueError("coordinates must be finite")
+    hm, hl = M - H, L - H
+    scale = np.linalg.norm(hm) * np.linalg.norm(hl)
+    if scale == 0 or abs(np.dot(hm, hl)) > RIGHT_ANGLE_TOLERANCE * scale:
+        raise ValueError("the triangle must have a right angle at H")
+    if not name:
+        name = "Restart_" + "_".join(f"{x:g}" for p in (H, M, L) for x in p[:2])
+    return {"name": output_name(str(name)), "H": H[:2].tolist(), "M": M[:2].tolist(), "L": L[:2].tolist(),
+            "row": where}
+
+
+def _jsonl_triangle(line, where):
+    job = json.loads(line)
+    if not isinstance(job, dict) or not {"H", "M", "L"} <= set(job):
+        raise ValueError("expected an object with \"H\", \"M\" and \"L\"")
+    return _triangle(job["H"], job["M"], job["L"], job.get("name"), where)
+
+
+def _csv_triangle(cells, where):
+    if len(cells) < 6:
+        raise ValueError("expected hx, hy, mx, my, lx, ly and an optional name")
+    name = cells[6] if len(cells) > 6 else None
+    return _triangle(cells[0:2], cells[2:4], cells[4:6], name, where)
+
+
+def read_triangles(path):
+    # A JSONL line is {"H": [x, y], "M": [x, y], "L": [x, y]} with an optional
+    # "name"; a CSV row is hx, hy, mx, my, lx, ly and an optional name. A row
+    # that is not a usable triangle is returned as {"row", "error"}.
+    path = Path(path)
+    jobs = []
+    with path.open(encoding="utf-8", newline="") as f:
+        jsonl = path.suffix == ".jsonl"
+        if jsonl:
+            rows = ((line_number, line) for line_number, line in enumerate(f, 1) if line.strip())
+        else:
+            rows = ((line_number, [cell.strip() for cell in row]) for line_number, row in enumerate(csv.reader(f), 1))
+            rows = ((line_number, cells) for line_number, cells in rows if any(cells))
+        for line_number, row in rows:
+            where = f"{path}:{line_number}"
+            try:
+                jobs.append(_jsonl_triangle(row, where) if jsonl else _csv_triangle(row, where))
+            except (ValueError, TypeError) as exc:
+                logger.error(f"Skipping {where}: {exc}")
+                jobs.append({"row": where, "error": str(exc)})
+    return jobs
+
+
+def _init_worker(script, scene_name):
+    # Each worker loads the scene once and keeps its label and geometry caches
+    # across triangles; the tex and section caches on disk are shared by all.
+    global _scene_cls
+    _scene_cls = load_scene_class(script, scene_name)
+
+
+def render_triangle(job, quality):
+    triangle = tuple(np.array([*job[name], 0.0]) for name in "HML")
+    scene_cls = type(job["name"], (_scene_cls,), {"triangle": triangle})
+    scene_cls.__module__ = _scene_cls.__module__
+    start = time.perf_counter()
+    with tempconfig({"quality": quality, "output_file": job["name"]}):
+        scene = scene_cls()
+        scene.render()
+        output = str(scene.renderer.file_writer.movie_file_path)
+    return {**job, "output": output, "seconds": round(time.perf_counter() - start, 2)}
+
+
+def sweep(triangle_file, script=SCRIPT, scene_name=SCENE, quality="low_quality", jobs=None, manifest=None):
+    manifest = Path(manifest or Path(triangle_file).with_suffix(".manifest.json"))
+    context = multiprocessing.get_context("spawn")
+    # Every row is checked before the first render; rejected rows go to the
+    # manifest as they are and the rest of the sweep still renders
+    results = read_triangles(triangle_file)
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=context,
+                             initializer=_init_worker, initargs=(script, scene_name)) as pool:
+        submitted = [(i, job, pool.submit(render_triangle, job, quality))
+                     for i, job in enumerate(results) if "error" not in job]
+        for i, job, future in submitted:
+            try:
+                results[i] = future.result()
+            except Exception as exc:
+                logger.error(f"Triangle {job['name']} failed: {exc!r}")
+                results[i] = {**job, "error": repr(exc)}
+    manifest.write_text(
+        json.dumps({"script": script, "quality": quality, "triangles": results}, indent=2), encoding="utf-8"
+    )
+    return manifest, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a Restart variant for every triangle in a CSV or JSONL file.")
+    parser.add_argument("triangles_file")
+    parser.add_argument("--script", default=SCRIPT)
+    parser.add_argument("--scene", default=SCENE)
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("-o", "--manifest", help="defaults to the triangles file with a .manifest.json suffix")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest, results = sweep(args.triangles_file, args.script, args.scene, QUALITIES[args.quality],
+                              args.jobs, args.manifest)
+    failed = sum(1 for result in results if "error" in result)
+    print(f"{len(results) - failed} rendered, {failed} failed, manifest {manifest} "
+          f"({time.perf_counter() - start:.1f}s)")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()